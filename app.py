@@ -1,5 +1,6 @@
 import streamlit as st
 from utils import apply_custom_css
+from skillgap.warmup import warmup_status
 
 # --- HOME CONTENT CONFIGURATION (Integrated) ---
 HOME_CONTENT = {
@@ -69,7 +70,7 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Apply Global Theme
+# Apply Global Theme (also starts the model warm-up)
 apply_custom_css()
 
 # Main Hero Section
@@ -149,3 +150,8 @@ for i, milestone in enumerate(HOME_CONTENT["milestones"]):
         st.page_link(milestone['page'], label=milestone['button_text'], icon=milestone['icon'], use_container_width=True)
 
 st.markdown(f"<center style='color: #7f8c8d;'>{HOME_CONTENT.get('footer_text', '')}</center>", unsafe_allow_html=True)
+
+warmup = warmup_status()
+if warmup["state"] != "idle":
+    timings = ", ".join(f"{stage['name']} {stage['seconds']:.1f}s" for stage in warmup["stages"])
+    st.caption(f"⚙️ Models: {warmup['state']}" + (f" ({timings})" if timings else ""))
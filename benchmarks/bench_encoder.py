@@ -0,0 +1,92 @@
+"""
+Sentence encoder backends on our skill pairs: PyTorch (SentenceTransformer)
+vs ONNX fp32 vs ONNX int8, latency and agreement with PyTorch.
+
+Pairs are every alias -> canonical pair in SKILL_ALIASES plus random SKILL_DB
+pairs. The ONNX graphs are exported on first use (see skillgap.encoders).
+
+    python benchmarks/bench_encoder.py --repeats 20
+    python benchmarks/bench_encoder.py --model /path/to/local/sentence-transformer
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def skill_pairs(rng, negatives=500):
+    from skillgap.skills_db import SKILL_ALIASES, SKILL_DB
+    pairs = list(SKILL_ALIASES.items())
+    pairs += [tuple(rng.sample(SKILL_DB, 2)) for _ in range(negatives)]
+    return pairs
+
+def load_backend(name, model):
+    from skillgap.encoders import load_onnx_encoder
+    if name == "torch":
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(model, device="cpu")
+    return load_onnx_encoder(model, quantize=(name == "onnx-int8"))
+
+def pair_scores(encoder, pairs):
+    left = encoder.encode([a for a, _ in pairs])
+    right = encoder.encode([b for _, b in pairs])
+    left = left / np.linalg.norm(left, axis=1, keepdims=True)
+    right = right / np.linalg.norm(right, axis=1, keepdims=True)
+    return (left * right).sum(axis=1)
+
+def call_ms(encoder, skills, repeats):
+    # One analysis worth of skills per call, median over repeats
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        encoder.encode(skills)
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)) * 1000
+
+def main():
+    from skillgap.analyzer import MATCH_THRESHOLD, SBERT_MODEL_NAME
+    from skillgap.encoders import export_onnx, onnx_dir
+    from skillgap.skills_db import SKILL_DB
+    
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=SBERT_MODEL_NAME)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--skills", type=int, default=25, help="Skills per encode() call for the latency figure.")
+    args = parser.parse_args()
+    
+    rng = random.Random(0)
+    pairs = skill_pairs(rng)
+    call_skills = rng.sample(SKILL_DB, min(args.skills, len(SKILL_DB)))
+    
+    if not os.path.exists(os.path.join(onnx_dir(args.model), "encoder.json")):
+        start = time.perf_counter()
+        export_onnx(args.model)
+        print(f"ONNX export: {time.perf_counter() - start:.1f} s")
+    
+    reference = None
+    print(f"{len(pairs)} skill pairs, {len(call_skills)} skills per call, threshold {MATCH_THRESHOLD}")
+    print(f"{'backend':10} {'load s':>7} {'ms/call':>8} {'pairs/s':>8} {'max |d|':>8} {'mean |d|':>9} {'same match':>10}")
+    for name in ("torch", "onnx-fp32", "onnx-int8"):
+        start = time.perf_counter()
+        encoder = load_backend(name, args.model)
+        load_s = time.perf_counter() - start
+        ms = call_ms(encoder, call_skills, args.repeats)
+        
+        start = time.perf_counter()
+        scores = pair_scores(encoder, pairs)
+        pairs_per_s = len(pairs) / (time.perf_counter() - start)
+        
+        if reference is None:
+            reference = scores
+        diff = np.abs(scores - reference)
+        agreement = np.mean((scores >= MATCH_THRESHOLD) == (reference >= MATCH_THRESHOLD)) * 100
+        print(f"{name:10} {load_s:7.2f} {ms:8.2f} {pairs_per_s:8.0f} {diff.max():8.4f} {diff.mean():9.4f} {agreement:9.1f}%")
+
+if __name__ == "__main__":
+    main()
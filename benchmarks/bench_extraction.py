@@ -0,0 +1,80 @@
+"""
+Per-document skill extraction latency and memory, fast vs full pipeline.
+
+Each mode runs in a fresh interpreter so load time and RSS are not shared.
+
+    python benchmarks/bench_extraction.py --docs 50
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def synthetic_resume(rng, words=600):
+    from skillgap.skills_db import SKILL_DB
+    filler = "designed built shipped maintained team product users data platform service the and with for".split()
+    tokens = []
+    while len(tokens) < words:
+        tokens.append(rng.choice(SKILL_DB) if rng.random() < 0.1 else rng.choice(filler))
+    return " ".join(tokens)
+
+def rss_mb():
+    # ru_maxrss is in KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_mode(mode, docs):
+    from skillgap.extractor import extract_skills_from_text, load_model
+    
+    rng = random.Random(0)
+    texts = [synthetic_resume(rng) for _ in range(docs)]
+    base_rss = rss_mb()
+    
+    start = time.perf_counter()
+    load_model(mode)
+    load_s = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    skills = [extract_skills_from_text(t, mode) for t in texts]
+    extract_s = time.perf_counter() - start
+    
+    return {
+        "mode": mode,
+        "load_s": load_s,
+        "ms_per_doc": extract_s / docs * 1000,
+        "rss_mb": rss_mb() - base_rss,
+        "skills": skills
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--docs", type=int, default=50)
+    parser.add_argument("--mode", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.docs)))
+        return
+    
+    results = {}
+    for mode in ("fast", "full"):
+        proc = subprocess.run([sys.executable, __file__, "--mode", mode, "--docs", str(args.docs)], capture_output=True, text=True)
+        if proc.returncode != 0:
+            print(f"{mode}: failed\n{proc.stderr.strip().splitlines()[-1]}")
+            continue
+        results[mode] = json.loads(proc.stdout.strip().splitlines()[-1])
+        r = results[mode]
+        print(f"{mode:5} load {r['load_s']:6.2f} s  {r['ms_per_doc']:7.2f} ms/doc  +{r['rss_mb']:7.1f} MB RSS")
+    
+    if len(results) == 2:
+        print(f"identical skills: {results['fast']['skills'] == results['full']['skills']}")
+
+if __name__ == "__main__":
+    main()
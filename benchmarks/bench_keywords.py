@@ -0,0 +1,69 @@
+"""
+Keyword scanning for the quality check and role / cert context: the original
+per-keyword substring tests vs the word-bounded KeywordScanner.
+
+Two synthetic texts: prose with sparse keywords, and a dense worst case where
+keywords (and near misses like "international", "github") make up most words.
+
+    python benchmarks/bench_keywords.py --mb 1.5
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def synthetic_text(rng, chars, keyword_rate):
+    from skillgap.keywords import CERTS_DB, ROLES_DB, SECTION_KEYWORDS, TOOLS_KEYWORDS
+    keywords = SECTION_KEYWORDS + ROLES_DB + CERTS_DB + TOOLS_KEYWORDS + ["international", "github", "digital"]
+    vocab = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(2, 9))) for _ in range(3000)]
+    words, size = [], 0
+    while size < chars:
+        word = rng.choice(keywords) if rng.random() < keyword_rate else rng.choice(vocab)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)
+
+def substring_path(text):
+    # Before the shared scanner: plain `in` tests on the lowercased text
+    from skillgap.keywords import CERTS_DB, ROLES_DB, SECTION_KEYWORDS
+    text_lower = text.lower()
+    sections = [sec for sec in SECTION_KEYWORDS if sec in text_lower]
+    roles = [r for r in ROLES_DB if r in text_lower]
+    certs = [c for c in CERTS_DB if c in text_lower]
+    return sections, roles, certs
+
+def scanner_path(text):
+    from skillgap.keywords import get_keyword_scanner
+    found = get_keyword_scanner().scan(text)
+    return found.get("section", set()), found.get("role", set()), found.get("cert", set())
+
+def timed_ms(fn, text, repeats):
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mb", type=float, default=1.5, help="Text size in MB.")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    chars = int(args.mb * 1e6)
+    for label, rate in (("sparse", 0.005), ("dense", 0.6)):
+        text = synthetic_text(rng, chars, rate)
+        old_ms = timed_ms(substring_path, text, args.repeats)
+        new_ms = timed_ms(scanner_path, text, args.repeats)
+        print(f"{label:6} {len(text) / 1e6:.2f} MB  substring {old_ms:7.1f} ms  scanner {new_ms:7.1f} ms  ({new_ms / old_ms:.1f}x)")
+
+if __name__ == "__main__":
+    main()
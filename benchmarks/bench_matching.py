@@ -0,0 +1,83 @@
+"""
+Best-match search over skill embeddings: the old per-element .item() loop
+vs the vectorized engine, and pairwise vs batched resume x JD scoring.
+
+Random unit vectors stand in for encoder output, so no model is needed.
+
+    python benchmarks/bench_matching.py --skills 1000 --dim 384
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def loop_best_matches(resume_embeddings, jd_embeddings):
+    # The previous calculate_similarity inner loop
+    import torch
+    from sentence_transformers import util
+    cosine_scores = util.cos_sim(torch.from_numpy(resume_embeddings), torch.from_numpy(jd_embeddings))
+    best_idx, best_scores = [], []
+    for j in range(len(jd_embeddings)):
+        max_score = -1
+        best_match_idx = -1
+        for i in range(len(resume_embeddings)):
+            score = cosine_scores[i][j].item()
+            if score > max_score:
+                max_score = score
+                best_match_idx = i
+        best_idx.append(best_match_idx)
+        best_scores.append(max_score)
+    return np.array(best_idx), np.array(best_scores)
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+def main():
+    from skillgap.matching import batch_best_matches, best_matches
+    
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--skills", type=int, default=1000, help="Skills per side for the single-pair comparison.")
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--jds", type=int, default=20)
+    parser.add_argument("--per-doc", type=int, default=30, help="Skills per resume / JD in the batch comparison.")
+    parser.add_argument("--skip-loop", action="store_true", help="Skip the (slow) .item() loop.")
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(0)
+    resume = rng.standard_normal((args.skills, args.dim), dtype=np.float32)
+    jd = rng.standard_normal((args.skills, args.dim), dtype=np.float32)
+    
+    (idx, scores), vec_s = timed(best_matches, resume, jd)
+    print(f"{args.skills} x {args.skills} skills")
+    print(f"  vectorized   {vec_s * 1000:10.1f} ms")
+    if not args.skip_loop:
+        (loop_idx, loop_scores), loop_s = timed(loop_best_matches, resume, jd)
+        print(f"  .item() loop {loop_s * 1000:10.1f} ms  ({loop_s / vec_s:.0f}x slower)")
+        print(f"  same matches: {bool((loop_idx == idx).all() and np.allclose(loop_scores, scores, atol=1e-5))}")
+    
+    sizes = lambda n: rng.integers(1, 2 * args.per_doc, n)
+    resumes = [rng.standard_normal((n, args.dim), dtype=np.float32) for n in sizes(args.resumes)]
+    jds = [rng.standard_normal((n, args.dim), dtype=np.float32) for n in sizes(args.jds)]
+    
+    pairwise, pair_s = timed(lambda: [[best_matches(r, j) for r in resumes] for j in jds])
+    batched, batch_s = timed(batch_best_matches, resumes, jds)
+    same = all(
+        (pairwise[j][r][0] == batched[j][0][:, r]).all() and np.allclose(pairwise[j][r][1], batched[j][1][:, r], atol=1e-5)
+        for j in range(len(jds)) for r in range(len(resumes))
+    )
+    print(f"{args.resumes} resumes x {args.jds} JDs (~{args.per_doc} skills each)")
+    print(f"  pairwise     {pair_s * 1000:10.1f} ms")
+    print(f"  batched      {batch_s * 1000:10.1f} ms  ({pair_s / batch_s:.1f}x faster)")
+    print(f"  same matches: {same}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Serial vs parallel PDF extraction, with the page / character budgets off
+(the default) or as configured (--budgets, what ingestion actually parses).
+Parallel timings include starting the worker pool.
+
+    python benchmarks/bench_pdf.py                 # synthetic 300-page PDF
+    python benchmarks/bench_pdf.py --pages 100 --budgets
+    python benchmarks/bench_pdf.py portfolio.pdf --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pymupdf as fitz  # PyMuPDF; the legacy "fitz" module prints a deprecation notice on import
+
+from skillgap import config
+from skillgap.parser import parse_pdf, pdf_pool_context
+
+
+def synthetic_pdf(pages):
+    doc = fitz.open()
+    line = "Experience: Python, SQL, Docker, Kubernetes, Machine Learning. " * 2
+    for i in range(pages):
+        page = doc.new_page()
+        page.insert_textbox(fitz.Rect(50, 50, 550, 800), f"Page {i + 1}\n" + line * 40, fontsize=9)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+def best_of(fn, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pdf", nargs="?")
+    parser.add_argument("--pages", type=int, default=300, help="Pages in the synthetic PDF.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--budgets", action="store_true",
+                        help="Apply config.PDF_MAX_PAGES / PDF_MAX_CHARS instead of parsing everything.")
+    args = parser.parse_args()
+    
+    if args.pdf:
+        with open(args.pdf, "rb") as f:
+            data = f.read()
+    else:
+        data = synthetic_pdf(args.pages)
+    with fitz.open(stream=data, filetype="pdf") as doc:
+        pages = doc.page_count
+    budgets = {} if args.budgets else {"max_pages": 0, "max_chars": 0}
+    if args.budgets and config.PDF_MAX_PAGES:
+        pages = min(pages, config.PDF_MAX_PAGES)
+    
+    serial_s, serial_text = best_of(lambda: parse_pdf(data, parallel=False, **budgets), args.repeat)
+    parallel_s, parallel_text = best_of(lambda: parse_pdf(data, parallel=True, **budgets), args.repeat)
+    
+    print(f"{pages} pages parsed, {len(data) / 1e6:.1f} MB, {len(serial_text)} chars, {config.PDF_WORKERS} workers "
+          f"({pdf_pool_context().get_start_method()}), pool used from {config.PDF_PARALLEL_MIN_PAGES} pages")
+    print(f"serial:   {serial_s * 1000:8.1f} ms  ({pages / serial_s:7.0f} pages/s)")
+    print(f"parallel: {parallel_s * 1000:8.1f} ms  ({pages / parallel_s:7.0f} pages/s)")
+    print(f"speedup:  {serial_s / parallel_s:.2f}x, identical output: {serial_text == parallel_text}")
+
+if __name__ == "__main__":
+    main()
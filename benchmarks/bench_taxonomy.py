@@ -0,0 +1,121 @@
+"""
+Startup time, memory and match throughput for a large external taxonomy.
+
+Generates a synthetic CSV taxonomy (default 50k skills, a third with an
+alias), then in a fresh interpreter per phase measures: loading the file,
+compiling the token trie (cold) or reading it back from disk (warm), and
+matching pre-tokenized documents against it.
+
+    python benchmarks/bench_taxonomy.py --terms 50000
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+SYLLABLES = "ka lo mi ra to zen vex qua dor pli nus ter bex gal fy or".split()
+
+
+def synthetic_word(rng):
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+def write_taxonomy(path, terms, seed=0):
+    rng = random.Random(seed)
+    names = set()
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "aliases"])
+        while len(names) < terms:
+            name = " ".join(synthetic_word(rng).title() for _ in range(rng.randint(1, 3)))
+            if name in names:
+                continue
+            names.add(name)
+            alias = "".join(w[0] for w in name.split()).upper() + str(len(names)) if rng.random() < 0.33 else ""
+            writer.writerow([name, alias])
+    return sorted(names)
+
+def synthetic_document(rng, names, words=600):
+    tokens = []
+    while len(tokens) < words:
+        tokens.append(rng.choice(names) if rng.random() < 0.05 else synthetic_word(rng))
+    return " ".join(tokens)
+
+def rss_mb():
+    # ru_maxrss is in KB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def run_phase(path, docs):
+    import spacy
+    from skillgap.matcher import index_path, load_skill_matcher
+    from skillgap.taxonomy import load_taxonomy
+
+    nlp = spacy.blank("en")
+    base_rss = rss_mb()
+
+    start = time.perf_counter()
+    taxonomy = load_taxonomy(path)
+    load_s = time.perf_counter() - start
+
+    warm = os.path.exists(index_path(nlp, taxonomy) + ".json")
+    start = time.perf_counter()
+    matcher = load_skill_matcher(nlp, taxonomy)
+    index_s = time.perf_counter() - start
+    index_rss = rss_mb() - base_rss
+
+    rng = random.Random(1)
+    texts = [synthetic_document(rng, taxonomy.names) for _ in range(docs)]
+    parsed = list(nlp.pipe(texts))
+    start = time.perf_counter()
+    matches = sum(len(matcher.match(doc)) for doc in parsed)
+    match_s = time.perf_counter() - start
+
+    return {
+        "skills": len(taxonomy),
+        "terms": sum(1 for _ in taxonomy.terms()),
+        "warm": warm,
+        "load_s": load_s,
+        "index_s": index_s,
+        "ms_per_doc": match_s / docs * 1000,
+        "matches": matches,
+        "rss_mb": index_rss
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--terms", type=int, default=50000)
+    parser.add_argument("--docs", type=int, default=50)
+    parser.add_argument("--phase", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.phase:
+        print(json.dumps(run_phase(args.phase, args.docs)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "taxonomy.csv")
+        write_taxonomy(path, args.terms)
+        # Keep the compiled index out of the real cache
+        env = dict(os.environ, SKILLGAP_CACHE_DIR=os.path.join(tmp, "cache"))
+
+        for label in ("cold", "warm"):
+            proc = subprocess.run([sys.executable, __file__, "--phase", path, "--docs", str(args.docs)],
+                                  capture_output=True, text=True, env=env)
+            if proc.returncode != 0:
+                print(f"{label}: failed\n{proc.stderr.strip().splitlines()[-1]}")
+                return
+            r = json.loads(proc.stdout.strip().splitlines()[-1])
+            print(f"{label}: {r['skills']} skills / {r['terms']} terms  load {r['load_s']:5.2f} s  "
+                  f"index {r['index_s']:5.2f} s  {r['ms_per_doc']:6.2f} ms/doc ({r['matches']} matches)  "
+                  f"+{r['rss_mb']:6.1f} MB RSS after load")
+
+if __name__ == "__main__":
+    main()
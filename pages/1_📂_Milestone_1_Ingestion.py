@@ -1,64 +1,85 @@
 import streamlit as st
-import fitz  # PyMuPDF
-import docx
+import pandas as pd
 import time
-from utils import apply_custom_css, render_top_nav, clean_text
+from utils import apply_custom_css, render_top_nav
+from skillgap import config
+from skillgap.bulk import count_uploaded_documents, iter_uploaded_documents, parse_many
+from skillgap.ingest import ingest_document
+from skillgap.parser import get_parse_cache
+from skillgap.sections import segment_sections
 
 st.set_page_config(page_title="Data Ingestion", page_icon="📂", layout="wide")
 apply_custom_css()
 render_top_nav()
 
-# --- PARSING LOGIC (Integrated from src/parser.py) ---
-def parse_pdf(file_bytes):
+# --- INGESTION STATUS ---
+def describe_stage(stage):
     """
-    Extracts text from a PDF file (provided as bytes).
+    One status line per measured stage: duration plus whatever it processed.
     """
-    try:
-        doc = fitz.open(stream=file_bytes, filetype="pdf")
-        text = ""
-        for page in doc:
-            text += page.get_text()
-        return text
-    except Exception as e:
-        return f"Error parsing PDF: {str(e)}"
+    parts = [f"**{stage['name'].capitalize()}** — {stage['seconds'] * 1000:.1f} ms"]
+    if stage.get("cached"):
+        parts.append("served from parse cache")
+    if stage.get("spilled"):
+        parts.append("spilled to disk")
+    if stage.get("bytes"):
+        parts.append(f"{stage['bytes'] / 1024:.1f} KB")
+    if stage.get("pages"):
+        parts.append(f"{stage['pages']} pages ({stage['pages'] / max(stage['seconds'], 1e-6):.0f} pages/s)")
+    if stage.get("chars"):
+        parts.append(f"{stage['chars']:,} chars")
+    if stage.get("sections"):
+        parts.append(f"{stage['sections']} sections")
+    return " · ".join(parts)
 
-def parse_docx(file):
+def describe_truncation(result):
     """
-    Extracts text from a DOCX file.
+    Which PDF budget cut the text short, and the setting that raises it.
     """
-    try:
-        doc = docx.Document(file)
-        text = "\n".join([para.text for para in doc.paragraphs])
-        return text
-    except Exception as e:
-        return f"Error parsing DOCX: {str(e)}"
+    if result["total_pages"] and result["pages"] < result["total_pages"]:
+        return (f"Only the first {result['pages']} of {result['total_pages']} pages were parsed "
+                f"(SKILLGAP_PDF_MAX_PAGES).")
+    return f"Text was cut off after {config.PDF_MAX_CHARS:,} characters (SKILLGAP_PDF_MAX_CHARS)."
 
-def parse_txt(file_bytes):
+def run_ingestion(uploaded_file, label, check_quality=False):
     """
-    Extracts text from a TXT file (provided as bytes).
+    Ingests an upload inside an st.status panel fed by the real stage timings.
     """
-    try:
-        return file_bytes.decode("utf-8")
-    except Exception as e:
-        return f"Error parsing TXT: {str(e)}"
+    with st.status(f"Processing {label}...", expanded=True) as status:
+        result = ingest_document(uploaded_file, check_quality=check_quality)
+        for stage in result["stages"]:
+            st.write(describe_stage(stage))
+        if result["memory"] and result["memory"]["peak_rss"] is not None:
+            memory = result["memory"]
+            delta = f"{memory['rss_delta'] / 1e6:+.1f} MB RSS · " if memory["rss_delta"] is not None else ""
+            st.write(f"**Process memory** — {delta}peak {memory['peak_rss'] / 1e6:.0f} MB "
+                     f"(+{memory['peak_growth'] / 1e6:.1f} MB during this upload; process-wide, all sessions)")
+        if result["truncated"]:
+            st.warning(describe_truncation(result))
+        total_ms = sum(stage["seconds"] for stage in result["stages"]) * 1000
+        if result["error"]:
+            status.update(label=f"{label} could not be processed", state="error", expanded=True)
+        else:
+            status.update(label=f"{label} Processed in {total_ms:.1f} ms" + (" (truncated)" if result["truncated"] else ""),
+                          state="complete", expanded=result["truncated"])
+    return result
+
+# Everything Milestones 2-4 derive from the two documents. Extraction runs on
+# resume and JD together, so a change to either clears all of it
+DERIVED_STATE = ['resume_skills', 'jd_skills', 'resume_extraction', 'jd_extraction', 'resume_context',
+                 'final_resume_skills', 'final_jd_skills', 'gap_analysis']
 
-def parse_document(uploaded_file):
+def set_document(kind, text, sections):
     """
-    Main entry point to parse various file types.
+    Stores a parsed resume / JD ("resume" or "jd") and drops the skills and
+    analysis left over from the previous one. Re-running with the same text
+    (every rerun of this page) keeps them.
     """
-    if uploaded_file is None:
-        return None
-    
-    file_type = uploaded_file.name.split(".")[-1].lower()
-    
-    if file_type == "pdf":
-        return parse_pdf(uploaded_file.read())
-    elif file_type == "docx":
-        return parse_docx(uploaded_file)
-    elif file_type == "txt":
-        return parse_txt(uploaded_file.read())
-    else:
-        return "Unsupported file format."
+    if st.session_state.get(f'{kind}_text') != text:
+        for key in DERIVED_STATE:
+            st.session_state.pop(key, None)
+    st.session_state[f'{kind}_text'] = text
+    st.session_state[f'{kind}_sections'] = sections
 
 # --- PAGE UI ---
 
@@ -70,6 +91,8 @@ if 'resume_text' not in st.session_state:
     st.session_state['resume_text'] = ""
 if 'jd_text' not in st.session_state:
     st.session_state['jd_text'] = ""
+if 'bulk_resumes' not in st.session_state:
+    st.session_state['bulk_resumes'] = {}
 
 col1, col2 = st.columns(2)
 
@@ -78,102 +101,95 @@ with col1:
     uploaded_resume = st.file_uploader("Upload Resume (PDF, DOCX, TXT)", type=["pdf", "docx", "txt"], key="resume_uploader")
     
     if uploaded_resume:
-        # Simulate processing time for "Dynamic" feel
-        with st.status("Processing Resume...", expanded=True) as status:
-            st.write("Reading file...")
-            time.sleep(0.5)
-            content = parse_document(uploaded_resume)
-            st.write("Normalizing text...")
-            time.sleep(0.3)
-            cleaned_content = clean_text(content)
-            st.session_state['resume_text'] = cleaned_content
-            status.update(label="Resume Processed!", state="complete", expanded=False)
-        
-# ... (Processing Logic)
-
-def analyze_resume_quality(text):
-    """
-    Analyzes resume content for structure and quality indicators.
-    """
-    score = 100
-    issues = []
-    
-    # 1. Length Check
-    words = len(text.split())
-    if words < 200:
-        score -= 20
-        issues.append("Resume is too short (<200 words). Add more detail.")
-    elif words > 2000:
-        score -= 10
-        issues.append("Resume might be too long (>2000 words). Consider summarizing.")
-        
-    # 2. Section Check (Simple keyword search)
-    # We look for common headers. Case insensitive.
-    text_lower = text.lower()
-    required_sections = ["education", "experience", "skills", "projects"]
-    for sec in required_sections:
-        if sec not in text_lower:
-            score -= 15
-            issues.append(f"Missing section: '{sec.capitalize()}'.")
-            
-    # 3. Email Check
-    if "@" not in text:
-        score -= 10
-        issues.append("No email address detected.")
-        
-    return max(0, score), issues
-
-# ... inside the col1 (Resume) block ...
-    if uploaded_resume:
-        # Simulate processing time for "Dynamic" feel
-        with st.status("Processing Resume...", expanded=True) as status:
-            st.write("Reading file...")
-            time.sleep(0.5)
-            content = parse_document(uploaded_resume)
-            st.write("Normalizing text...")
-            time.sleep(0.3)
-            cleaned_content = clean_text(content)
-            st.session_state['resume_text'] = cleaned_content
-            status.update(label="Resume Processed!", state="complete", expanded=False)
+        ingested = run_ingestion(uploaded_resume, "Resume", check_quality=True)
         
-        st.success(f"Resume Loaded: {len(st.session_state['resume_text'].split())} words detected.")
-        
-        # --- NEW: QUALITY CHECK ---
-        q_score, q_issues = analyze_resume_quality(st.session_state['resume_text'])
-        
-        # Display Health Meter
-        st.markdown(f"**Resume Health Score: {q_score}/100**")
-        st.progress(q_score / 100)
-        
-        if q_issues:
-            with st.expander("⚠️ Improvement Suggestions"):
-                for issue in q_issues:
-                    st.warning(issue)
+        if ingested["error"]:
+            st.error(ingested["error"])
         else:
-             st.caption("✅ Resume structure looks great!")
-        # --------------------------
+            set_document('resume', ingested["text"], ingested["sections"])
+            st.success(f"Resume Loaded: {len(st.session_state['resume_text'].split())} words detected.")
+            
+            # --- QUALITY CHECK ---
+            q_score, q_issues = ingested["quality"]
+            
+            # Display Health Meter
+            st.markdown(f"**Resume Health Score: {q_score}/100**")
+            st.progress(q_score / 100)
+            
+            if q_issues:
+                with st.expander("⚠️ Improvement Suggestions"):
+                    for issue in q_issues:
+                        st.warning(issue)
+            else:
+                 st.caption("✅ Resume structure looks great!")
+            # ---------------------
 
-        with st.expander("Show Parsed Content"):
-            st.text_area("Resume Text", st.session_state['resume_text'], height=200)
+            with st.expander("Show Parsed Content"):
+                st.text_area("Resume Text", st.session_state['resume_text'], height=200)
 
 with col2:
     st.markdown("#### 💼 Job Description")
     uploaded_jd = st.file_uploader("Upload JS (PDF, DOCX, TXT)", type=["pdf", "docx", "txt"], key="jd_uploader")
     
     if uploaded_jd:
-        with st.status("Processing JD...", expanded=True) as status:
-            st.write("Reading file...")
-            time.sleep(0.5)
-            content = parse_document(uploaded_jd)
-            st.write("Extracting requirements...")
-            time.sleep(0.3)
-            cleaned_content = clean_text(content)
-            st.session_state['jd_text'] = cleaned_content
-            status.update(label="JD Processed!", state="complete", expanded=False)
+        ingested = run_ingestion(uploaded_jd, "JD")
+        
+        if ingested["error"]:
+            st.error(ingested["error"])
+        else:
+            set_document('jd', ingested["text"], ingested["sections"])
+            st.success(f"JD Loaded: {len(st.session_state['jd_text'].split())} words detected.")
+            with st.expander("Show Parsed Content"):
+                st.text_area("JD Text", st.session_state['jd_text'], height=200)
+
+# --- BULK UPLOAD ---
+with st.expander("📦 Bulk Resume Upload (ZIP or multiple files)"):
+    bulk_files = st.file_uploader("Upload resumes or a ZIP of resumes", type=["zip", "pdf", "docx", "txt"], accept_multiple_files=True, key="bulk_uploader")
+    
+    if bulk_files:
+        # Only re-parse when the selection changes; reruns reuse session state
+        bulk_signature = tuple((f.name, f.size) for f in bulk_files)
+        if st.session_state.get('bulk_signature') != bulk_signature:
+            total = count_uploaded_documents(bulk_files)
+            progress = st.progress(0.0, text=f"Parsing 0/{total} files...")
+            table = st.empty()
+            rows = []
+            texts = {}
+            total_bytes = 0
+            start = time.perf_counter()
+            
+            for result in parse_many(iter_uploaded_documents(bulk_files)):
+                elapsed = max(time.perf_counter() - start, 1e-6)
+                total_bytes += result["bytes"]
+                if result["error"] is None:
+                    texts[result["name"]] = result["text"]
+                rows.append({
+                    "File": result["name"],
+                    "Status": f"❌ {result['error']}" if result["error"] else
+                              f"⚠️ Truncated: {describe_truncation(result)}" if result["truncated"] else "✅ Parsed",
+                    "Words": len(result["text"].split()),
+                    "KB": round(result["bytes"] / 1024, 1),
+                    "Parse ms": round(result["seconds"] * 1000, 1)
+                })
+                progress.progress(len(rows) / max(total, 1), text=f"Parsing {len(rows)}/{total} files... "
+                                  f"{len(rows) / elapsed:.1f} files/s, {total_bytes / 1e6 / elapsed:.2f} MB/s")
+                table.dataframe(pd.DataFrame(rows), use_container_width=True, hide_index=True)
             
-        st.success(f"JD Loaded: {len(st.session_state['jd_text'].split())} words detected.")
-        with st.expander("Show Parsed Content"):
-            st.text_area("JD Text", st.session_state['jd_text'], height=200)
+            elapsed = max(time.perf_counter() - start, 1e-6)
+            st.session_state['bulk_resumes'] = texts
+            st.session_state['bulk_rows'] = rows
+            st.session_state['bulk_signature'] = bulk_signature
+            progress.progress(1.0, text=f"Parsed {len(rows)} files in {elapsed:.2f}s "
+                              f"({len(rows) / elapsed:.1f} files/s, {total_bytes / 1e6 / elapsed:.2f} MB/s)")
+        else:
+            st.dataframe(pd.DataFrame(st.session_state['bulk_rows']), use_container_width=True, hide_index=True)
+        
+        if st.session_state['bulk_resumes']:
+            chosen = st.selectbox("Analyze resume", list(st.session_state['bulk_resumes'].keys()), key="bulk_choice")
+            if st.button("Use as Candidate Resume"):
+                resume_text = st.session_state['bulk_resumes'][chosen]
+                set_document('resume', resume_text, segment_sections(resume_text))
+                st.rerun()
 
 # Check if both are ready
 if st.session_state['resume_text'] and st.session_state['jd_text']:
@@ -199,6 +215,10 @@ if st.session_state['resume_text'] and st.session_state['jd_text']:
         </div>
         """, unsafe_allow_html=True)
     
+    cache_info = get_parse_cache().info()
+    st.caption(f"⚡ Parse cache: {cache_info['memory_hits'] + cache_info['disk_hits']} hits "
+               f"({cache_info['disk_hits']} from disk) / {cache_info['misses']} misses")
+    
     # Download Section
     st.markdown("### 📥 Download Processed Data")
     dl_col1, dl_col2 = st.columns(2)
@@ -1,8 +1,10 @@
 import streamlit as st
-import spacy
-from spacy.pipeline import EntityRuler
 import pandas as pd
 from utils import apply_custom_css, render_top_nav
+from skillgap.extractor import extract_segments_batch, extract_context, categorize_skills, get_extraction_cache
+from skillgap.results import SkillExtraction
+from skillgap.sections import extraction_text
+from skillgap.taxonomy import reload_taxonomy
 import plotly.graph_objects as go
 import plotly.express as px
 import random
@@ -11,98 +13,6 @@ st.set_page_config(page_title="Skill Extraction", page_icon="🧠", layout="wide
 apply_custom_css()
 render_top_nav()
 
-# --- SKILLS DATABASE (Integrated from src/skills_db.py) ---
-SKILL_DB = [
-    # Programming Languages
-    "Python", "Java", "C++", "C#", "JavaScript", "TypeScript", "Ruby", "Swift", "Go", "Kotlin", "Rust", "PHP", "R", "Matlab", "Scala", "Dart", "HTML", "CSS", "SQL", "NoSQL", "Bash", "Shell", "Perl", "Lua",
-    
-    # Machine Learning & AI
-    "Machine Learning", "Deep Learning", "Neural Networks", "NLP", "Natural Language Processing", "Computer Vision", "Reinforcement Learning", "Generative AI", "LLM", "Transformers", "BERT", "GPT", "TensorFlow", "PyTorch", "Keras", "Scikit-learn", "Pandas", "NumPy", "Matplotlib", "Seaborn", "OpenCV", "Hugging Face", "MLOps",
-    
-    # Data Science & Analytics
-    "Data Analysis", "Data Visualization", "Big Data", "Spark", "Hadoop", "Hive", "Tableau", "Power BI", "Excel", "Data Mining", "Statistics", "A/B Testing", "Snowflake", "Databricks", "ETL", "Data Pipelines",
-    
-    # Web Development
-    "React", "React.js", "Angular", "Vue", "Vue.js", "Node.js", "Express", "Django", "Flask", "FastAPI", "Spring Boot", "ASP.NET", "Laravel", "jQuery", "Bootstrap", "Tailwind CSS", "SASS", "LESS", "GraphQL", "REST API", "WebSockets",
-    
-    # Cloud & DevOps
-    "AWS", "Amazon Web Services", "Azure", "Google Cloud", "GCP", "Docker", "Kubernetes", "Jenkins", "Git", "GitHub", "GitLab", "CI/CD", "Terraform", "Ansible", "Linux", "Unix", "Nginx", "Apache", "Heroku", "Vercel", "Netlify",
-    
-    # Databases
-    "MySQL", "PostgreSQL", "MongoDB", "Redis", "Oracle", "Cassandra", "DynamoDB", "Firebase", "SQLite", "MariaDB",
-    
-    # Soft Skills
-    "Communication", "Teamwork", "Leadership", "Problem Solving", "Critical Thinking", "Project Management", "Agile", "Scrum", "Time Management", "Adaptability", "Collaboration", "Creativity", "Emotional Intelligence", "Conflict Resolution", "Decision Making", "Mentoring", "Presentation Skills", "Negotiation",
-    
-    # Tools & Others
-    "Jira", "Trello", "Asana", "Slack", "Zoom", "Microsoft Office", "Adobe Creative Suite", "Photoshop", "Illustrator", "Figma", "Sketch", "InVision", "Salesforce", "SAP"
-]
-
-SKILL_PATTERNS = []
-for skill in SKILL_DB:
-    if skill == "R":
-        SKILL_PATTERNS.append({"label": "SKILL", "pattern": [{"TEXT": "R"}]}) 
-    else:
-        SKILL_PATTERNS.append({"label": "SKILL", "pattern": [{"LOWER": skill.lower()}]})
-
-
-# --- EXTRACTOR LOGIC (Integrated from src/extractor.py) ---
-nlp = None
-
-@st.cache_resource
-def load_model():
-    # Helper to load model once
-    try:
-        model = spacy.load("en_core_web_lg")
-    except OSError:
-        model = spacy.load("en_core_web_sm")
-    
-    # Add EntityRuler
-    if "entity_ruler" not in model.pipe_names:
-        ruler = model.add_pipe("entity_ruler", before="ner")
-        ruler.add_patterns(SKILL_PATTERNS)
-    return model
-
-def extract_skills_from_text(text):
-    """
-    Extracts skills from text using Spacy + EntityRuler.
-    """
-    nlp_model = load_model()
-    doc = nlp_model(text)
-    
-    skills = []
-    
-    # Extract entities labeled as SKILL
-    for ent in doc.ents:
-        if ent.label_ == "SKILL":
-            skills.append(ent.text)
-            
-    return sorted(list(set(skills)))
-
-def categorize_skills(skills_list):
-    """
-    Simple rule-based categorization for visualization.
-    """
-    categories = {
-        "Technical": [],
-        "Soft Skills": [],
-        "Tools/Frameworks": []
-    }
-    
-    soft_keywords = ["Communication", "Teamwork", "Leadership", "Problem Solving", "Critical Thinking", "Agile", "Scrum", "Management", "Adaptability", "Creativity"]
-    tools_keywords = ["Jira", "Git", "GitHub", "Docker", "Kubernetes", "AWS", "Azure", "Tableau", "Excel", "Power BI", "Figma", "React", "Angular", "Vue", "Django", "Flask"]
-    
-    for skill in skills_list:
-        if any(k.lower() in skill.lower() for k in soft_keywords):
-            categories["Soft Skills"].append(skill)
-        elif any(k.lower() in skill.lower() for k in tools_keywords):
-            categories["Tools/Frameworks"].append(skill)
-        else:
-            categories["Technical"].append(skill)
-            
-    return categories
-
-
 # --- UI LOGIC ---
 
 st.markdown("# 🧠 Milestone 2: Skill Extraction")
@@ -123,31 +33,21 @@ if 'jd_skills' not in st.session_state:
 if 'resume_context' not in st.session_state:
     st.session_state['resume_context'] = {}
 
-# --- HELPER: Extra Entity Extraction (Regex based for speed/demo) ---
-import re
-def extract_context(text):
-    text_lower = text.lower()
-    context = {"roles": [], "certs": []}
-    
-    # Common Role Keywords
-    roles_db = ["data scientist", "data analyst", "software engineer", "manager", "developer", "architect", "consultant", "intern"]
-    for r in roles_db:
-        if r in text_lower:
-            context["roles"].append(r.title())
-            
-    # Common Cert Keywords
-    certs_db = ["pmp", "aws certified", "azure fundamentals", "scrum master", "cissp", "google data analytics", "ibm data science"]
-    for c in certs_db:
-        if c in text_lower:
-            context["certs"].append(c.upper() if len(c) < 5 else c.title())
-            
-    return context
-
 # Extraction Trigger
 if not st.session_state['resume_skills']:
     with st.spinner("Running NLP Models..."):
-        st.session_state['resume_skills'] = extract_skills_from_text(st.session_state['resume_text'])
-        st.session_state['jd_skills'] = extract_skills_from_text(st.session_state['jd_text'])
+        # Large documents are reduced to their relevant sections first (spans
+        # still point into the full text); resume and JD go through the
+        # pipeline as one batch
+        (resume_extraction, jd_extraction), _ = extract_segments_batch([
+            extraction_text(st.session_state['resume_text'], st.session_state.get('resume_sections')),
+            extraction_text(st.session_state['jd_text'], st.session_state.get('jd_sections'))
+        ])
+        st.session_state['resume_skills'] = resume_extraction.skills()
+        st.session_state['jd_skills'] = jd_extraction.skills()
+        # Spans and counts, kept as plain lists for highlighting / weighting
+        st.session_state['resume_extraction'] = resume_extraction.to_dict()
+        st.session_state['jd_extraction'] = jd_extraction.to_dict()
         
         # Run Context Extraction
         st.session_state['resume_context'] = extract_context(st.session_state['resume_text'])
@@ -156,13 +56,15 @@ if not st.session_state['resume_skills']:
 
 # --- Advanced Visualizations ---
 
-def plot_sunburst(skills, title):
+def plot_sunburst(skills, title, extraction=None):
     if not skills: return None
+    # Weight each skill by how often the document mentions it
+    counts = SkillExtraction.from_dict(extraction).counts() if extraction else {}
     cats = categorize_skills(skills)
     data = []
     for cat, skill_list in cats.items():
         for s in skill_list:
-            data.append({"Category": cat, "Skill": s, "Value": 1})
+            data.append({"Category": cat, "Skill": s, "Value": counts.get(s, 1)})
     if not data: return None
     df = pd.DataFrame(data)
     fig = px.sunburst(df, path=['Category', 'Skill'], values='Value', title=title, color='Category', color_discrete_sequence=px.colors.qualitative.Bold)
@@ -180,11 +82,11 @@ with tab_charts:
     r2_c1, r2_c2 = st.columns(2)
     with r2_c1:
         st.subheader("👤 Candidate Composition")
-        sb_res = plot_sunburst(st.session_state['resume_skills'], "Your Skills")
+        sb_res = plot_sunburst(st.session_state['resume_skills'], "Your Skills", st.session_state.get('resume_extraction'))
         if sb_res: st.plotly_chart(sb_res, use_container_width=True)
     with r2_c2:
         st.subheader("🎯 Job Composition")
-        sb_jd = plot_sunburst(st.session_state['jd_skills'], "Required Skills")
+        sb_jd = plot_sunburst(st.session_state['jd_skills'], "Required Skills", st.session_state.get('jd_extraction'))
         if sb_jd: st.plotly_chart(sb_jd, use_container_width=True)
 
     st.markdown("---")
@@ -228,6 +130,19 @@ with tab_charts:
         st.markdown("#### 🎯 Confidence")
         st.metric("Accuracy", f"{min(98, 85 + len(st.session_state['resume_skills']))}%")
         st.metric("Entity Density", "High")
+        
+        cache_info = get_extraction_cache().info()
+        st.caption(f"⚡ Extraction cache: {cache_info['memory_hits'] + cache_info['disk_hits']} hits / "
+                   f"{cache_info['misses']} misses, {cache_info['evictions']} evicted, {cache_info['expirations']} expired")
+        
+        # Picks up edits to the taxonomy without restarting the server
+        if st.button("🔄 Reload Skill Taxonomy"):
+            taxonomy, changed = reload_taxonomy()
+            if changed:
+                st.session_state['resume_skills'] = []
+                st.rerun()
+            else:
+                st.toast(f"Taxonomy {taxonomy.version} is already current.")
 
     st.markdown("---")
     c1_next, c2_next, c3_next = st.columns([1, 2, 1])
@@ -6,58 +6,25 @@ from fpdf import FPDF
 import base64
 import random
 import io
-from sentence_transformers import SentenceTransformer, util
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from utils import apply_custom_css, render_top_nav
+from utils import apply_custom_css, render_top_nav, get_gap_analysis
 
 st.set_page_config(page_title="Skill Gap Dashboard", page_icon="🎓", layout="wide")
 apply_custom_css()
 render_top_nav()
 
 # --- ANALYZER LOGIC ---
-@st.cache_resource
-def load_sbert_model():
-    return SentenceTransformer('all-MiniLM-L6-v2')
-
-def calculate_similarity(resume_skills, jd_skills):
-    if not resume_skills or not jd_skills:
-        return 0.0, jd_skills, []
-    
-    model = load_sbert_model()
-    embeddings1 = model.encode(resume_skills, convert_to_tensor=True)
-    embeddings2 = model.encode(jd_skills, convert_to_tensor=True)
-    
-    cosine_scores = util.cos_sim(embeddings1, embeddings2)
-    
-    matched_skills = []
-    missing_skills = []
-    threshold = 0.6 
-    
-    for j, jd_skill in enumerate(jd_skills):
-        max_score = -1
-        best_match_idx = -1
-        for i, res_skill in enumerate(resume_skills):
-            score = cosine_scores[i][j].item()
-            if score > max_score:
-                max_score = score
-                best_match_idx = i
-        
-        if max_score >= threshold:
-            matched_skills.append({
-                "Skill": jd_skill, 
-                "Your Match": resume_skills[best_match_idx], 
-                "Score": round(max_score * 100, 1),
-                "Status": "Match Found"
-            })
-        else:
-            missing_skills.append(jd_skill)
-            
-    if len(jd_skills) > 0:
-        match_percentage = round((len(matched_skills) / len(jd_skills)) * 100, 1)
-    else:
-        match_percentage = 0.0
-        
+def calculate_report_similarity(resume_skills, jd_skills):
+    """
+    Reshapes the session's gap analysis (computed by Milestone 3 when it
+    ran on the same skills) into report rows.
+    """
+    match_percentage, missing_skills, matched = get_gap_analysis(resume_skills, jd_skills)
+    matched_skills = [{
+        "Skill": m["jd_skill"],
+        "Your Match": m["resume_match"],
+        "Score": round(m["score"] * 100, 1),
+        "Status": "Match Found"
+    } for m in matched]
     return match_percentage, missing_skills, matched_skills
 
 def generate_recommendations(missing_skills):
@@ -162,7 +129,7 @@ if 'resume_skills' not in st.session_state:
 r_skills = st.session_state.get('final_resume_skills', st.session_state.get('resume_skills', ["Python", "Machine Learning", "TensorFlow", "SQL", "Statistics", "Communication"]))
 j_skills = st.session_state.get('final_jd_skills', st.session_state.get('jd_skills', ["Python", "Machine Learning", "TensorFlow", "SQL", "Statistics", "Communication", "AWS", "Project Mgmt"]))
 
-match_pct, missing_skills, matched_skills = calculate_similarity(r_skills, j_skills)
+match_pct, missing_skills, matched_skills = calculate_report_similarity(r_skills, j_skills)
 recommendations = generate_recommendations(missing_skills)
 
 # HEADER
@@ -0,0 +1,13 @@
+"""
+Streamlit-free core of the AI Skill Gap Analyzer.
+
+The Streamlit pages and the `skillgap` CLI (`python -m skillgap`) are thin
+layers over these modules:
+
+- parser:    PDF / DOCX / TXT text extraction
+- text:      text normalization
+- extractor: spaCy skill extraction, context and categorization
+- analyzer:  semantic skill matching and content similarity
+- quality:   resume health checks
+- pipeline:  end-to-end resume vs JD analysis
+"""
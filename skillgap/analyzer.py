@@ -0,0 +1,148 @@
+import threading
+from functools import lru_cache
+
+from skillgap import config
+from skillgap.embeddings import encode_skills
+from skillgap.matching import batch_best_matches, best_matches
+from skillgap.taxonomy import canonicalize_skills
+
+# sentence-transformers (and torch), onnxruntime and sklearn are imported where
+# they are used, so importing this module stays cheap until a model is needed
+
+SBERT_MODEL_NAME = "all-MiniLM-L6-v2"
+
+# Minimum cosine similarity for a JD skill to count as matched
+MATCH_THRESHOLD = 0.6
+
+
+_SBERT_LOCK = threading.Lock()
+
+
+# --- ANALYZER LOGIC (Formerly src/analyzer.py) ---
+def load_sbert_model():
+    """
+    Loads the sentence encoder once per process. Concurrent callers (e.g. a
+    page and the background warm-up) wait for the same load.
+
+    With config.ENCODER_BACKEND "onnx" this is an OnnxEncoder, which has the
+    same encode() but always returns numpy arrays.
+    """
+    with _SBERT_LOCK:
+        return _load_sbert_model()
+
+@lru_cache(maxsize=None)
+def _load_sbert_model():
+    if config.ENCODER_BACKEND == "onnx":
+        from skillgap.encoders import load_onnx_encoder
+        return load_onnx_encoder(SBERT_MODEL_NAME)
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(SBERT_MODEL_NAME)
+
+def calculate_similarity(resume_skills, jd_skills, threshold=MATCH_THRESHOLD, score_digits=2):
+    """
+    Calculates semantic similarity between skill lists.
+
+    Returns (match_percentage, missing_skills, matched_skills), where each
+    matched entry is {"jd_skill", "resume_match", "score"}. Scores are rounded
+    to `score_digits` decimals; None keeps them raw for callers that round
+    for display.
+
+    Both lists are canonicalized and deduplicated first. JD skills the resume
+    lists under the same canonical name match with score 1.0; only the rest
+    are embedded, from the precomputed taxonomy embeddings where possible.
+    """
+    resume_skills = canonicalize_skills(resume_skills)
+    jd_skills = canonicalize_skills(jd_skills)
+    if not resume_skills or not jd_skills:
+        return 0.0, jd_skills, []
+    
+    resume_set = set(resume_skills)
+    pending = [jd_skill for jd_skill in jd_skills if jd_skill not in resume_set]
+    best = {}
+    
+    if pending:
+        best_idx, best_scores = best_matches(encode_skills(resume_skills), encode_skills(pending))
+        for jd_skill, i, score in zip(pending, best_idx, best_scores):
+            best[jd_skill] = (resume_skills[i], float(score))
+    
+    return _summarize_matches(jd_skills, resume_set, best, threshold, score_digits)
+
+def calculate_similarity_batch(resume_skill_lists, jd_skill_lists, threshold=MATCH_THRESHOLD, score_digits=2):
+    """
+    calculate_similarity for every (JD, resume) pair at once.
+
+    Returns results[j][r] == calculate_similarity(resume_skill_lists[r],
+    jd_skill_lists[j]). Each distinct skill is embedded once, and all pairs
+    are scored with a single matrix product.
+    """
+    resume_skill_lists = [canonicalize_skills(skills) for skills in resume_skill_lists]
+    jd_skill_lists = [canonicalize_skills(skills) for skills in jd_skill_lists]
+    vocabulary = sorted({skill for skills in resume_skill_lists + jd_skill_lists for skill in skills})
+    if not vocabulary:
+        return [[(0.0, [], []) for _ in resume_skill_lists] for _ in jd_skill_lists]
+    
+    embeddings = encode_skills(vocabulary)
+    row = {skill: i for i, skill in enumerate(vocabulary)}
+    resume_batch = [embeddings[[row[skill] for skill in skills]] for skills in resume_skill_lists]
+    jd_batch = [embeddings[[row[skill] for skill in skills]] for skills in jd_skill_lists]
+    
+    results = []
+    for jd_skills, (best_idx, best_scores) in zip(jd_skill_lists, batch_best_matches(resume_batch, jd_batch)):
+        row_results = []
+        for r, resume_skills in enumerate(resume_skill_lists):
+            if not resume_skills or not jd_skills:
+                row_results.append((0.0, jd_skills, []))
+                continue
+            best = {jd_skill: (resume_skills[best_idx[j, r]], float(best_scores[j, r]))
+                    for j, jd_skill in enumerate(jd_skills)}
+            row_results.append(_summarize_matches(jd_skills, set(resume_skills), best, threshold, score_digits))
+        results.append(row_results)
+    return results
+
+def _summarize_matches(jd_skills, resume_set, best, threshold, score_digits=2):
+    """
+    (match_percentage, missing_skills, matched_skills) from the best resume
+    match per JD skill; exact canonical matches score 1.0.
+    """
+    matched_skills = []
+    missing_skills = []
+    for jd_skill in jd_skills:
+        resume_match, max_score = (jd_skill, 1.0) if jd_skill in resume_set else best[jd_skill]
+        if max_score >= threshold:
+            matched_skills.append({
+                "jd_skill": jd_skill,
+                "resume_match": resume_match,
+                "score": max_score if score_digits is None else round(max_score, score_digits)
+            })
+        else:
+            missing_skills.append(jd_skill)
+            
+    if len(jd_skills) > 0:
+        match_percentage = round((len(matched_skills) / len(jd_skills)) * 100, 1)
+    else:
+        match_percentage = 0.0
+        
+    return match_percentage, missing_skills, matched_skills
+
+def calculate_content_similarity(text1, text2):
+    """
+    Calculates cosine similarity between texts.
+    """
+    if not text1 or not text2:
+        return 0.0
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+    vectorizer = TfidfVectorizer(stop_words='english')
+    try:
+        tfidf_matrix = vectorizer.fit_transform([text1, text2])
+        score = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+        return round(score * 100, 1)
+    except:
+        return 0.0
+
+def composite_score(match_percentage, content_score, skill_importance=0.7):
+    """
+    Weighted blend of skill overlap and content similarity.
+    """
+    content_importance = 1.0 - skill_importance
+    return round((match_percentage * skill_importance) + (content_score * content_importance), 1)
@@ -0,0 +1,171 @@
+import os
+import zipfile
+import zlib
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from skillgap import config
+from skillgap.ingest import UploadLimitError, check_upload_size, ingest_bytes, ingest_error
+from skillgap.parser import SUPPORTED_EXTENSIONS, file_extension, list_documents, pdf_pool_context
+
+
+# --- BULK INGESTION ---
+def _is_supported_member(info):
+    base = os.path.basename(info.filename)
+    if info.is_dir() or not base or base.startswith(".") or info.filename.startswith("__MACOSX/"):
+        return False
+    return file_extension(base) in SUPPORTED_EXTENSIONS
+
+def zip_document_names(file):
+    """
+    Names of the supported documents inside a ZIP, read from its central directory.
+    """
+    with zipfile.ZipFile(file) as archive:
+        return [info.filename for info in archive.infolist() if _is_supported_member(info)]
+
+def _read_member(archive, info, budget):
+    # The declared size is checked before decompressing anything; the read is
+    # capped too, in case the header understates it
+    limit = config.MAX_UPLOAD_BYTES
+    check_upload_size(info.file_size)
+    if budget is not None and info.file_size > budget:
+        raise UploadLimitError(f"Archive expands beyond {config.ZIP_MAX_TOTAL_BYTES / 1e6:.1f} MB in total.")
+    with archive.open(info) as member:
+        data = member.read(limit + 1 if limit else -1)
+    check_upload_size(len(data))
+    if budget is not None and len(data) > budget:
+        raise UploadLimitError(f"Archive expands beyond {config.ZIP_MAX_TOTAL_BYTES / 1e6:.1f} MB in total.")
+    return data
+
+# Per-member read failures: limits, encryption, corrupt or unsupported data
+_MEMBER_ERRORS = (UploadLimitError, RuntimeError, NotImplementedError, zipfile.BadZipFile, zlib.error, EOFError, OSError)
+
+def iter_zip_documents(file, prefix=""):
+    """
+    Yields (name, bytes) for each supported document in a ZIP, named by its
+    full path in the archive (after `prefix`). Members are decompressed in
+    memory one at a time, nothing is written to disk.
+
+    Each member is held to config.MAX_UPLOAD_BYTES and the archive as a whole
+    to config.ZIP_MAX_TOTAL_BYTES (decompressed); members over a limit are
+    yielded as (name, UploadLimitError) without being decompressed. Members
+    that can't be read (encrypted, corrupt) are yielded as (name, exception)
+    too, and an unreadable archive as one such pair, so a bad entry never
+    stops the rest.
+    """
+    budget = config.ZIP_MAX_TOTAL_BYTES or None
+    try:
+        archive = zipfile.ZipFile(file)
+    except (zipfile.BadZipFile, OSError) as e:
+        yield prefix.rstrip("/") or str(getattr(file, "name", file)), ValueError(f"Could not open archive: {e}")
+        return
+    with archive:
+        for info in archive.infolist():
+            if not _is_supported_member(info):
+                continue
+            name = prefix + info.filename
+            try:
+                data = _read_member(archive, info, budget)
+            except UploadLimitError as e:
+                yield name, e
+                continue
+            except _MEMBER_ERRORS as e:
+                yield name, ValueError(f"Could not read from archive: {e}")
+                continue
+            if budget is not None:
+                budget -= len(data)
+            yield name, data
+
+def iter_directory_documents(directory):
+    """
+    Yields (name, bytes) for each supported document in a directory.
+    """
+    for path in list_documents(directory):
+        with open(path, "rb") as f:
+            yield path, f.read()
+
+def _iter_uploads(uploaded_files):
+    for uploaded in uploaded_files:
+        if file_extension(uploaded.name) == "zip":
+            uploaded.seek(0)
+            yield from iter_zip_documents(uploaded, prefix=uploaded.name + "/")
+        else:
+            yield uploaded.name, uploaded.getvalue()
+
+def iter_uploaded_documents(uploaded_files):
+    """
+    Yields (name, bytes) from Streamlit uploads, expanding any ZIP archives.
+    Archive members are named "archive.zip/path/in/archive"; names are
+    unique across the whole upload (repeats become "name (2).pdf", ...), so
+    they can key results.
+    """
+    seen = {}
+    for name, data in _iter_uploads(uploaded_files):
+        seen[name] = seen.get(name, 0) + 1
+        if seen[name] > 1:
+            stem, ext = os.path.splitext(name)
+            name = f"{stem} ({seen[name]}){ext}"
+        yield name, data
+
+def count_uploaded_documents(uploaded_files):
+    total = 0
+    for uploaded in uploaded_files:
+        if file_extension(uploaded.name) == "zip":
+            uploaded.seek(0)
+            try:
+                total += len(zip_document_names(uploaded))
+            except zipfile.BadZipFile:
+                total += 1  # reported as one error row
+        else:
+            total += 1
+    return total
+
+def _parse_one(name, file_bytes, cache):
+    if isinstance(file_bytes, Exception):
+        result = ingest_error(name, str(file_bytes))
+    else:
+        result = ingest_bytes(file_bytes, name, cache)
+    result["seconds"] = sum(stage["seconds"] for stage in result["stages"])
+    return result
+
+def _init_pdf_process():
+    # Each worker already handles a whole PDF; no nested page-range pools
+    config.PDF_PARALLEL_MIN_PAGES = 0
+
+def _pdf_executor(cache):
+    """
+    Where PDFs are parsed. PyMuPDF is not thread-safe and holds the GIL, so
+    never on the shared thread pool: on a process pool (the PDF pool's start
+    method, config.PDF_WORKERS processes, each using its own parse cache), or
+    serially on one thread when there is a single worker or an explicit
+    `cache` that can't leave this process.
+    """
+    if cache is None and config.PDF_WORKERS > 1:
+        return ProcessPoolExecutor(max_workers=config.PDF_WORKERS, mp_context=pdf_pool_context(),
+                                   initializer=_init_pdf_process)
+    return ThreadPoolExecutor(max_workers=1)
+
+def parse_many(documents, max_workers=None, cache=None):
+    """
+    Parses (name, bytes) pairs and yields one ingest_bytes result per
+    document, plus its total "seconds", as soon as it finishes (completion
+    order). DOCX and TXT documents go to a bounded thread pool, PDFs to
+    _pdf_executor. An exception in place of the bytes (see
+    iter_zip_documents) becomes an error result.
+
+    At most 2 x max_workers documents are held in memory at once, so large
+    archives are never fully materialized.
+    """
+    max_workers = max_workers or config.BULK_WORKERS
+    with ThreadPoolExecutor(max_workers=max_workers) as pool, _pdf_executor(cache) as pdf_pool:
+        pending = set()
+        for name, file_bytes in documents:
+            is_pdf = file_extension(name) == "pdf" and not isinstance(file_bytes, Exception)
+            pending.add((pdf_pool if is_pdf else pool).submit(_parse_one, name, file_bytes, cache))
+            if len(pending) >= max_workers * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
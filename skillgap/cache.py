@@ -0,0 +1,166 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+def content_key(data, *parts):
+    """
+    SHA-256 of `data` (bytes-like or str), suffixed with any extra key parts.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return digest_key(hashlib.sha256(data).hexdigest(), *parts)
+
+def digest_key(digest, *parts):
+    """
+    Cache key from an already computed hex digest.
+    """
+    return ":".join([digest] + [str(p) for p in parts])
+
+
+class TieredCache:
+    """
+    Thread-safe cache with an in-memory LRU tier in front of an optional
+    SQLite tier, so entries survive server restarts.
+
+    Values are stored in SQLite through `dumps`/`loads` (JSON by default).
+    With `ttl` (seconds), entries older than that are dropped from both tiers
+    on lookup and count as misses, and expired rows are purged from SQLite on
+    every write. With `max_disk_items`, the SQLite tier is bounded too: the
+    least recently stored or disk-read rows are deleted first.
+    """
+
+    def __init__(self, name, max_items=256, db_path=None, dumps=json.dumps, loads=json.loads, ttl=None,
+                 max_disk_items=None):
+        self.name = name
+        self.max_items = max_items
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_disk_items = max_disk_items
+        self._dumps = dumps
+        self._loads = loads
+        self._memory = OrderedDict()  # key -> (value, stored_at)
+        self._lock = threading.Lock()
+        self._db = None
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0, "disk_evictions": 0, "expirations": 0}
+
+    def _connect(self):
+        if self._db is None and self.db_path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            # Streamlit runs each session in its own thread; access is serialized by self._lock
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute(f"CREATE TABLE IF NOT EXISTS {self.name} (key TEXT PRIMARY KEY, value BLOB, stored_at REAL, used_at REAL)")
+            columns = [row[1] for row in self._db.execute(f"PRAGMA table_info({self.name})")]
+            if "stored_at" not in columns:
+                # Tables created before TTL support; treat old rows as fresh
+                self._db.execute(f"ALTER TABLE {self.name} ADD COLUMN stored_at REAL")
+            if "used_at" not in columns:
+                # Tables created before the disk bound; old rows are evicted first
+                self._db.execute(f"ALTER TABLE {self.name} ADD COLUMN used_at REAL")
+            self._db.execute(f"CREATE INDEX IF NOT EXISTS {self.name}_used_at ON {self.name} (used_at)")
+            self._db.execute(f"CREATE INDEX IF NOT EXISTS {self.name}_stored_at ON {self.name} (stored_at)")
+            self._db.commit()
+        return self._db
+
+    def _remember(self, key, value, stored_at):
+        self._memory[key] = (value, stored_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def _expired(self, stored_at):
+        return self.ttl is not None and stored_at is not None and time.time() - stored_at > self.ttl
+
+    def get(self, key):
+        """
+        Returns the cached value for `key`, or None.
+        """
+        with self._lock:
+            expired = False
+            if key in self._memory:
+                value, stored_at = self._memory[key]
+                if not self._expired(stored_at):
+                    self._memory.move_to_end(key)
+                    self.stats["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+                expired = True
+            
+            db = self._connect()
+            if db is not None:
+                row = db.execute(f"SELECT value, stored_at FROM {self.name} WHERE key = ?", (key,)).fetchone()
+                if row is not None and self._expired(row[1]):
+                    db.execute(f"DELETE FROM {self.name} WHERE key = ?", (key,))
+                    db.commit()
+                    expired = True
+                elif row is not None:
+                    value = self._loads(row[0])
+                    if self.max_disk_items:
+                        db.execute(f"UPDATE {self.name} SET used_at = ? WHERE key = ?", (time.time(), key))
+                        db.commit()
+                    self._remember(key, value, row[1])
+                    self.stats["disk_hits"] += 1
+                    return value
+            
+            if expired:
+                self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, key, value):
+        with self._lock:
+            stored_at = time.time()
+            self._remember(key, value, stored_at)
+            db = self._connect()
+            if db is not None:
+                db.execute(f"INSERT OR REPLACE INTO {self.name} (key, value, stored_at, used_at) VALUES (?, ?, ?, ?)",
+                           (key, self._dumps(value), stored_at, stored_at))
+                self._trim_disk(db)
+                db.commit()
+
+    def _trim_disk(self, db):
+        if self.ttl is not None:
+            expired = db.execute(f"DELETE FROM {self.name} WHERE stored_at < ?", (time.time() - self.ttl,)).rowcount
+            self.stats["expirations"] += expired
+        if not self.max_disk_items:
+            return
+        excess = db.execute(f"SELECT COUNT(*) FROM {self.name}").fetchone()[0] - self.max_disk_items
+        if excess > 0:
+            db.execute(f"DELETE FROM {self.name} WHERE key IN "
+                       f"(SELECT key FROM {self.name} ORDER BY used_at LIMIT ?)", (excess,))
+            self.stats["disk_evictions"] += excess
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the cached value, computing and storing it on a miss.
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if value is not None:
+                self.put(key, value)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._memory.clear()
+            db = self._connect()
+            if db is not None:
+                db.execute(f"DELETE FROM {self.name}")
+                db.commit()
+
+    def info(self):
+        """
+        Hit/miss/eviction counters plus the current size of the memory tier.
+        """
+        with self._lock:
+            info = dict(self.stats)
+            info["memory_items"] = len(self._memory)
+        lookups = info["memory_hits"] + info["disk_hits"] + info["misses"]
+        info["hit_rate"] = round((info["memory_hits"] + info["disk_hits"]) / lookups, 3) if lookups else 0.0
+        return info
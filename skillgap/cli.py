@@ -0,0 +1,165 @@
+import argparse
+import json
+import sys
+import time
+
+from skillgap.analyzer import MATCH_THRESHOLD
+from skillgap.bulk import iter_directory_documents, iter_zip_documents, parse_many
+from skillgap.extractor import extract_skills_from_text, iter_extract_skills
+from skillgap.pipeline import analyze_texts, load_text
+from skillgap.sections import extraction_text, joined_extraction_text
+
+
+def _print_summary(result):
+    print(f"Composite score:    {result['composite_score']}%")
+    print(f"Skill overlap:      {result['match_percentage']}%")
+    print(f"Content similarity: {result['content_similarity']}%")
+    print(f"Matched ({len(result['matched'])}): " + ", ".join(m["jd_skill"] for m in result["matched"]))
+    print(f"Missing ({len(result['missing'])}): " + ", ".join(result["missing"]))
+
+def cmd_analyze(args):
+    result = analyze_texts(load_text(args.resume), load_text(args.jd),
+                           threshold=args.threshold, skill_importance=args.skill_weight)
+    result["resume"] = args.resume
+    result["jd"] = args.jd
+    if args.json:
+        print(json.dumps(result))
+    else:
+        _print_summary(result)
+    return 0
+
+def cmd_batch(args):
+    jd_text = load_text(args.jd)
+    jd_skills = extract_skills_from_text(joined_extraction_text(jd_text))
+    
+    if args.source.lower().endswith(".zip"):
+        documents = iter_zip_documents(args.source)
+    else:
+        documents = iter_directory_documents(args.source)
+    
+    corpus = None
+    if args.save_docs:
+        from skillgap.corpus import DocCorpus
+        from skillgap.extractor import load_model
+        corpus = DocCorpus(load_model())
+    
+    failures = 0
+    extracted = 0
+    start = time.perf_counter()
+    # Parsing runs concurrently and feeds one batched nlp.pipe stream;
+    # results come out in parse completion order
+    parsed_docs = parse_many(documents, max_workers=args.workers)
+    pairs = ((joined_extraction_text(p["text"], p["sections"]) if not p["error"] else "", p) for p in parsed_docs)
+    for resume_skills, parsed in iter_extract_skills(pairs, batch_size=args.batch_size, n_process=args.processes, as_tuples=True):
+        if parsed["error"]:
+            failures += 1
+            result = {"resume": parsed["name"], "error": parsed["error"]}
+        else:
+            extracted += 1
+            try:
+                result = analyze_texts(parsed["text"], jd_text, jd_skills=jd_skills, resume_skills=resume_skills,
+                                       threshold=args.threshold, skill_importance=args.skill_weight)
+                result["resume"] = parsed["name"]
+                if corpus is not None:
+                    corpus.add(parsed["name"], parsed["text"], extraction_text(parsed["text"], parsed["sections"]))
+            except Exception as e:
+                failures += 1
+                result = {"resume": parsed["name"], "error": str(e)}
+        _write_result(result)
+    
+    if corpus is not None:
+        corpus.to_disk(args.save_docs)
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(f"Scored {extracted} documents in {elapsed:.2f}s ({extracted / elapsed:.1f} docs/s), {failures} failed",
+          file=sys.stderr)
+    return 1 if failures else 0
+
+def cmd_rescore(args):
+    from skillgap.corpus import DocCorpus
+    from skillgap.extractor import load_model
+    from skillgap.taxonomy import reload_taxonomy
+    
+    taxonomy, _ = reload_taxonomy(args.taxonomy)
+    jd_text = load_text(args.jd)
+    jd_skills = extract_skills_from_text(joined_extraction_text(jd_text))
+    corpus = DocCorpus.from_disk(load_model(), args.corpus)
+    
+    failures = 0
+    scored = 0
+    start = time.perf_counter()
+    # Only the matcher runs: the stored tokens are re-matched as they are
+    for name, text, extraction in corpus.rematch(taxonomy):
+        try:
+            result = analyze_texts(text, jd_text, jd_skills=jd_skills, resume_skills=extraction.skills(),
+                                   threshold=args.threshold, skill_importance=args.skill_weight)
+            result["resume"] = name
+            scored += 1
+        except Exception as e:
+            failures += 1
+            result = {"resume": name, "error": str(e)}
+        _write_result(result)
+    
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(f"Re-scored {scored} documents against taxonomy {taxonomy.version} in {elapsed:.2f}s "
+          f"({scored / elapsed:.1f} docs/s), {failures} failed", file=sys.stderr)
+    return 1 if failures else 0
+
+def _write_result(result):
+    # One JSON object per line, flushed so consumers can stream it
+    sys.stdout.write(json.dumps(result) + "\n")
+    sys.stdout.flush()
+
+def cmd_warmup(args):
+    from skillgap.timing import StageTimer
+    from skillgap.warmup import warm_up
+    timer = StageTimer()
+    error = None
+    try:
+        warm_up(timer=timer)
+    except Exception as e:
+        error = e
+    for stage in timer.stages:
+        print(f"{stage['name']:<30} {stage['seconds']:6.2f} s")
+    print(f"{'total':<30} {timer.total():6.2f} s")
+    if error is not None:
+        print(f"Warm-up failed: {error}", file=sys.stderr)
+        return 1
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="skillgap", description="Headless AI Skill Gap Analyzer.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--threshold", type=float, default=MATCH_THRESHOLD, help="Minimum similarity for a skill match.")
+    common.add_argument("--skill-weight", type=float, default=0.7, help="Weight of skill overlap in the composite score (0-1).")
+    
+    p_analyze = sub.add_parser("analyze", parents=[common], help="Score one resume against one JD.")
+    p_analyze.add_argument("resume")
+    p_analyze.add_argument("jd")
+    p_analyze.add_argument("--json", action="store_true", help="Print the full result as JSON.")
+    p_analyze.set_defaults(func=cmd_analyze)
+    
+    p_batch = sub.add_parser("batch", parents=[common], help="Score every resume in a directory or ZIP, streaming NDJSON.")
+    p_batch.add_argument("source", help="Directory or .zip of resumes.")
+    p_batch.add_argument("--jd", required=True)
+    p_batch.add_argument("--workers", type=int, default=None, help="Parsing threads (default: SKILLGAP_BULK_WORKERS).")
+    p_batch.add_argument("--batch-size", type=int, default=None, help="Documents per nlp.pipe batch (default: SKILLGAP_EXTRACT_BATCH_SIZE).")
+    p_batch.add_argument("--processes", type=int, default=None, help="Extraction processes (default: SKILLGAP_EXTRACT_PROCESSES).")
+    p_batch.add_argument("--save-docs", metavar="CORPUS", help="Also store the tokenized resumes (.spacy DocBin) for 'rescore'.")
+    p_batch.set_defaults(func=cmd_batch)
+    
+    p_rescore = sub.add_parser("rescore", parents=[common], help="Re-match a saved corpus against the current taxonomy, streaming NDJSON.")
+    p_rescore.add_argument("corpus", help="DocBin written by 'batch --save-docs'.")
+    p_rescore.add_argument("--jd", required=True)
+    p_rescore.add_argument("--taxonomy", default=None, help="Taxonomy CSV/JSONL to switch to (default: SKILLGAP_TAXONOMY / built-in).")
+    p_rescore.set_defaults(func=cmd_rescore)
+    
+    p_warmup = sub.add_parser("warmup", help="Load the NLP models and report import / load times.")
+    p_warmup.set_defaults(func=cmd_warmup)
+    
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
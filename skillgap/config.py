@@ -0,0 +1,99 @@
+import os
+
+# --- RUNTIME SETTINGS ---
+# Every setting can be overridden with a SKILLGAP_* environment variable.
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+def _env_flag(name, default):
+    return os.environ.get(name, "1" if default else "0").lower() not in ("0", "false", "no", "")
+
+# Root directory for on-disk caches
+CACHE_DIR = os.environ.get("SKILLGAP_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "skillgap"))
+
+# Parse cache: in-memory LRU size, whether the SQLite tier is enabled and its
+# row limit (0 is unbounded)
+PARSE_CACHE_SIZE = _env_int("SKILLGAP_PARSE_CACHE_SIZE", 256)
+PARSE_CACHE_DISK = _env_flag("SKILLGAP_PARSE_CACHE_DISK", True)
+PARSE_CACHE_DISK_ITEMS = _env_int("SKILLGAP_PARSE_CACHE_DISK_ITEMS", 10000)
+
+# PDF extraction budget; 0 disables the limit
+PDF_MAX_PAGES = _env_int("SKILLGAP_PDF_MAX_PAGES", 100)
+PDF_MAX_CHARS = _env_int("SKILLGAP_PDF_MAX_CHARS", 500000)
+
+# Parallel PDF extraction: documents with at least this many pages (after the
+# page budget) are split across a process pool; 0 disables it. Starting the
+# workers costs more than extracting a few hundred pages serially, so with the
+# default PDF_MAX_PAGES the pool only runs once that budget is raised or off
+PDF_PARALLEL_MIN_PAGES = _env_int("SKILLGAP_PDF_PARALLEL_MIN_PAGES", 400)
+PDF_WORKERS = _env_int("SKILLGAP_PDF_WORKERS", min(4, os.cpu_count() or 1))
+
+# DOCX backend: "stream" (zip + incremental XML) or "python-docx"
+DOCX_BACKEND = os.environ.get("SKILLGAP_DOCX_BACKEND", "stream")
+
+# Bulk ingestion: size of the parsing thread pool
+BULK_WORKERS = _env_int("SKILLGAP_BULK_WORKERS", 4)
+
+# Documents longer than this (in characters) are reduced to their relevant
+# sections before skill extraction; 0 always extracts from the full text
+LARGE_DOC_CHARS = _env_int("SKILLGAP_LARGE_DOC_CHARS", 20000)
+
+# Upload limits, enforced before any parsing; 0 disables a limit
+MAX_UPLOAD_BYTES = _env_int("SKILLGAP_MAX_UPLOAD_BYTES", 25 * 1024 * 1024)
+MAX_UPLOAD_PAGES = _env_int("SKILLGAP_MAX_UPLOAD_PAGES", 1000)
+
+# ZIP archives: limit on the decompressed size of all members together (each
+# member is also held to MAX_UPLOAD_BYTES); 0 disables it
+ZIP_MAX_TOTAL_BYTES = _env_int("SKILLGAP_ZIP_MAX_TOTAL_BYTES", 200 * 1024 * 1024)
+
+# Uploads at least this large are spilled to a temp file and parsed from
+# disk instead of from memory
+SPILL_TO_DISK_BYTES = _env_int("SKILLGAP_SPILL_TO_DISK_BYTES", 8 * 1024 * 1024)
+
+# Report process memory (RSS change and high-water mark, native allocations
+# included) around each ingestion
+TRACK_MEMORY = _env_flag("SKILLGAP_TRACK_MEMORY", True)
+
+# Load the spaCy pipeline and sentence encoder on a background thread when
+# the app starts, so they are resident before the first analysis
+WARMUP = _env_flag("SKILLGAP_WARMUP", True)
+
+# Skill extraction pipeline: "fast" (tokenizer + skill matcher only) or
+# "full" (en_core_web_lg / sm with tagger, parser, lemmatizer and NER)
+EXTRACTION_MODE = os.environ.get("SKILLGAP_EXTRACTION_MODE", "fast")
+
+# External skill taxonomy (CSV or JSONL of name / aliases); empty uses the
+# built-in SKILL_DB
+TAXONOMY_PATH = os.environ.get("SKILLGAP_TAXONOMY", "")
+
+# Batched extraction (nlp.pipe): documents per batch and worker processes
+EXTRACT_BATCH_SIZE = _env_int("SKILLGAP_EXTRACT_BATCH_SIZE", 64)
+EXTRACT_PROCESSES = _env_int("SKILLGAP_EXTRACT_PROCESSES", 1)
+
+# Texts longer than this (in characters) are extracted chunk by chunk, cut at
+# paragraph / sentence boundaries, so memory stays bounded and spaCy's
+# max_length is never hit
+EXTRACT_CHUNK_CHARS = _env_int("SKILLGAP_EXTRACT_CHUNK_CHARS", 100000)
+
+# Extraction cache: results keyed by text hash, taxonomy version and model,
+# shared across sessions; TTL in seconds (0 keeps entries until evicted) and
+# SQLite row limit (0 is unbounded)
+EXTRACT_CACHE_SIZE = _env_int("SKILLGAP_EXTRACT_CACHE_SIZE", 1024)
+EXTRACT_CACHE_TTL = _env_int("SKILLGAP_EXTRACT_CACHE_TTL", 7 * 24 * 3600)
+EXTRACT_CACHE_DISK = _env_flag("SKILLGAP_EXTRACT_CACHE_DISK", True)
+EXTRACT_CACHE_DISK_ITEMS = _env_int("SKILLGAP_EXTRACT_CACHE_DISK_ITEMS", 50000)
+
+# Skill embeddings: the taxonomy is encoded once into a memory-mapped .npy
+# file; skills outside it are encoded on demand and cached (memory LRU size,
+# SQLite tier on / off and its row limit)
+EMBED_CACHE_SIZE = _env_int("SKILLGAP_EMBED_CACHE_SIZE", 4096)
+EMBED_CACHE_DISK = _env_flag("SKILLGAP_EMBED_CACHE_DISK", True)
+EMBED_CACHE_DISK_ITEMS = _env_int("SKILLGAP_EMBED_CACHE_DISK_ITEMS", 100000)
+
+# Sentence encoder backend: "torch" (SentenceTransformer) or "onnx" (the same
+# model exported once to CACHE_DIR/onnx and served through onnxruntime, int8
+# quantized unless ONNX_QUANTIZE is off); ONNX_THREADS 0 lets onnxruntime pick
+ENCODER_BACKEND = os.environ.get("SKILLGAP_ENCODER_BACKEND", "torch")
+ONNX_QUANTIZE = _env_flag("SKILLGAP_ONNX_QUANTIZE", True)
+ONNX_THREADS = _env_int("SKILLGAP_ONNX_THREADS", 0)
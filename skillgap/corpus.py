@@ -0,0 +1,86 @@
+from spacy.tokens import DocBin
+
+from skillgap import config
+from skillgap.matcher import load_skill_matcher
+from skillgap.results import SkillExtraction
+from skillgap.taxonomy import get_taxonomy
+from skillgap.text import iter_text_chunks
+
+
+# --- TOKENIZED CORPUS ---
+class DocCorpus:
+    """
+    Tokenized documents stored as a spaCy DocBin, so skills can be re-matched
+    after a taxonomy update without re-parsing or re-tokenizing anything.
+
+    Each document is stored as one Doc per extraction chunk; user_data keeps
+    the document name and the chunk's character offset, and the first chunk
+    also carries the full document text.
+    """
+
+    def __init__(self, nlp):
+        self.nlp = nlp
+        self.docs = DocBin(attrs=["ORTH", "SPACY"], store_user_data=True)
+
+    def add(self, name, text, segments=None):
+        """
+        Tokenizes (tokenizer only, no pipeline components) and stores a text.
+        Only `segments`, the (offset, text) parts extraction reads (see
+        sections.extraction_text), are tokenized; by default the whole text.
+        """
+        full_text = text
+        for base, segment in segments or [(0, text)]:
+            chunk_chars = config.EXTRACT_CHUNK_CHARS or len(segment) or 1
+            for offset, chunk in iter_text_chunks(segment, chunk_chars):
+                doc = self.nlp.make_doc(chunk)
+                doc.user_data["name"] = name
+                doc.user_data["offset"] = base + offset
+                if full_text is not None:
+                    doc.user_data["text"] = full_text
+                    full_text = None
+                self.docs.add(doc)
+
+    def __len__(self):
+        return len(self.docs)
+
+    def to_disk(self, path):
+        self.docs.to_disk(path)
+
+    @classmethod
+    def from_disk(cls, nlp, path):
+        corpus = cls(nlp)
+        corpus.docs = DocBin(store_user_data=True).from_disk(path)
+        return corpus
+
+    def iter_documents(self):
+        """
+        Yields (name, chunk Docs) per document, in insertion order.
+        """
+        name, chunks = None, []
+        for doc in self.docs.get_docs(self.nlp.vocab):
+            if chunks and doc.user_data["name"] != name:
+                yield name, chunks
+                chunks = []
+            name = doc.user_data["name"]
+            chunks.append(doc)
+        if chunks:
+            yield name, chunks
+
+    def rematch(self, taxonomy=None):
+        """
+        Re-runs only the skill matcher over the stored tokens. Yields
+        (name, full text, SkillExtraction) per document, in insertion order;
+        spans refer to the full text.
+        """
+        if taxonomy is None:
+            taxonomy = get_taxonomy()
+        matcher = load_skill_matcher(self.nlp, taxonomy)
+        for name, chunks in self.iter_documents():
+            result = SkillExtraction(taxonomy.version)
+            for doc in chunks:
+                for skill_id, start, end in matcher.match(doc):
+                    span = doc[start:end]
+                    result.add(skill_id, taxonomy.names[skill_id],
+                               span.start_char + doc.user_data["offset"], span.end_char + doc.user_data["offset"])
+            # Corpora saved before the full text was stored only have the chunks
+            yield name, chunks[0].user_data.get("text", "".join(doc.text for doc in chunks)), result
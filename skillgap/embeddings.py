@@ -0,0 +1,146 @@
+import os
+import re
+import threading
+from functools import lru_cache
+
+import numpy as np
+
+from skillgap import config
+from skillgap.cache import TieredCache, content_key
+from skillgap.encoders import encoder_name as backend_encoder_name
+from skillgap.matching import normalize_rows
+from skillgap.taxonomy import get_taxonomy
+
+# The encoder comes from skillgap.analyzer, imported where it is used: the
+# analyzer imports this module, and a typical analysis never loads the model
+
+_LOCK = threading.Lock()
+_MATRIX = {}  # path -> the current taxonomy's embedding matrix
+_STATS = {"taxonomy_hits": 0, "cache_hits": 0, "encoded": 0}
+
+
+# --- SKILL EMBEDDINGS ---
+def encoder_name():
+    from skillgap.analyzer import SBERT_MODEL_NAME
+    return backend_encoder_name(SBERT_MODEL_NAME)
+
+def _encode(skills):
+    from skillgap.analyzer import load_sbert_model
+    _STATS["encoded"] += len(skills)
+    return normalize_rows(load_sbert_model().encode(list(skills)))
+
+def embeddings_path(taxonomy):
+    """
+    Where a taxonomy's embedding matrix lives, versioned by encoder and
+    taxonomy content.
+    """
+    encoder = re.sub(r"[^\w.-]+", "_", encoder_name())
+    return os.path.join(config.CACHE_DIR, "embeddings", f"{encoder}-{taxonomy.version}.npy")
+
+def _save_matrix(matrix, path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Write then rename, so other processes never map a partial file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, matrix)
+    os.replace(tmp_path, path)
+
+def build_taxonomy_embeddings(taxonomy, path=None):
+    """
+    Encodes every canonical skill name and saves the float32 matrix (row i is
+    skill ID i) as .npy. Returns the path.
+    """
+    path = path or embeddings_path(taxonomy)
+    _save_matrix(_encode(taxonomy.names), path)
+    return path
+
+def taxonomy_embeddings(taxonomy=None):
+    """
+    The taxonomy's embedding matrix, built on first use and then memory-mapped
+    read-only, so every worker process shares the same pages.
+    """
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    path = embeddings_path(taxonomy)
+    with _LOCK:
+        if path not in _MATRIX:
+            _MATRIX.clear()
+            matrix = None
+            if os.path.exists(path):
+                try:
+                    matrix = np.load(path, mmap_mode="r")
+                except OSError:
+                    pass  # unreadable file; re-encoded below
+            if matrix is None:
+                # Only the file operations fall back: encoder errors propagate
+                matrix = _encode(taxonomy.names)
+                try:
+                    _save_matrix(matrix, path)
+                    matrix = np.load(path, mmap_mode="r")
+                except OSError:
+                    pass  # cache directory not writable: keep this process's copy in memory
+            _MATRIX[path] = matrix
+        return _MATRIX[path]
+
+@lru_cache(maxsize=1)
+def get_embedding_cache():
+    """
+    Process-wide cache for skills outside the taxonomy, bounded in memory and
+    on disk.
+    """
+    db_path = os.path.join(config.CACHE_DIR, "embedding_cache.sqlite3") if config.EMBED_CACHE_DISK else None
+    return TieredCache("embeddings", max_items=config.EMBED_CACHE_SIZE, db_path=db_path,
+                       dumps=_dump_vector, loads=_load_vector, max_disk_items=config.EMBED_CACHE_DISK_ITEMS or None)
+
+def _dump_vector(vector):
+    return np.asarray(vector, dtype=np.float32).tobytes()
+
+def _load_vector(blob):
+    return np.frombuffer(blob, dtype=np.float32)
+
+def encode_skills(skills, taxonomy=None):
+    """
+    Unit-length embeddings for canonical skill names, one row per skill.
+
+    Taxonomy skills are rows of the precomputed matrix; other skills come from
+    the embedding cache, and only cache misses reach the encoder, in one
+    batch.
+    """
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    skills = list(skills)
+    if not skills:
+        return np.zeros((0, 0), dtype=np.float32)
+    
+    vectors = {}
+    known = [skill for skill in skills if skill in taxonomy.ids]
+    if known:
+        matrix = taxonomy_embeddings(taxonomy)
+        # Fancy indexing copies just these rows out of the memory map
+        vectors.update(zip(known, matrix[[taxonomy.ids[skill] for skill in known]]))
+        _STATS["taxonomy_hits"] += len(known)
+    
+    cache = get_embedding_cache()
+    encoder = encoder_name()
+    unknown = []
+    for skill in dict.fromkeys(skills):
+        if skill in vectors:
+            continue
+        vector = cache.get(content_key(skill, "embedding", encoder))
+        if vector is None:
+            unknown.append(skill)
+        else:
+            vectors[skill] = vector
+            _STATS["cache_hits"] += 1
+    
+    if unknown:
+        for skill, vector in zip(unknown, _encode(unknown)):
+            cache.put(content_key(skill, "embedding", encoder), vector)
+            vectors[skill] = vector
+    return np.stack([vectors[skill] for skill in skills])
+
+def embedding_stats():
+    """
+    Skills served from the taxonomy matrix, from the cache, and encoded.
+    """
+    return dict(_STATS)
@@ -0,0 +1,151 @@
+import json
+import os
+import re
+import shutil
+
+import numpy as np
+
+from skillgap import config
+
+# Bump when the exported graph or its metadata changes
+ONNX_EXPORT_VERSION = "1"
+
+_INPUT_NAMES = ("input_ids", "attention_mask", "token_type_ids")
+
+
+# --- ENCODER BACKENDS ---
+def encoder_name(model_name, backend=None):
+    """
+    Identifies the embeddings a backend produces, for cache keys and
+    embedding files: the int8 graph's vectors differ slightly from PyTorch's.
+    """
+    backend = backend or config.ENCODER_BACKEND
+    if backend == "onnx":
+        return f"{model_name}-onnx{'-int8' if config.ONNX_QUANTIZE else ''}-v{ONNX_EXPORT_VERSION}"
+    return model_name
+
+def onnx_dir(model_name):
+    return os.path.join(config.CACHE_DIR, "onnx", re.sub(r"[^\w.-]+", "_", model_name) + f"-v{ONNX_EXPORT_VERSION}")
+
+def export_onnx(model_name, path=None):
+    """
+    Exports a SentenceTransformer (from its locally cached weights) to ONNX:
+    model.onnx, its int8 dynamically quantized copy model.int8.onnx, the
+    tokenizer and an encoder.json with the graph's inputs. Returns the
+    directory.
+
+    The graph covers the whole module stack (transformer, pooling,
+    normalization), so serving it needs only onnxruntime and tokenizers.
+    """
+    import torch
+    from onnxruntime.quantization import QuantType, quantize_dynamic
+    from sentence_transformers import SentenceTransformer
+    
+    path = path or onnx_dir(model_name)
+    model = SentenceTransformer(model_name, device="cpu").eval()
+    tokenizer = model.tokenizer
+    input_names = [name for name in _INPUT_NAMES if name in tokenizer.model_input_names]
+    sample = tokenizer(["Machine Learning", "SQL"], padding=True, return_tensors="pt")
+    
+    class SentenceEmbedding(torch.nn.Module):
+        def __init__(self):
+            super().__init__()
+            self.model = model
+        
+        def forward(self, *inputs):
+            return self.model(dict(zip(input_names, inputs)))["sentence_embedding"]
+    
+    # Export into a scratch directory and rename it into place, so a
+    # concurrent loader never sees a partial export
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    os.makedirs(tmp_path, exist_ok=True)
+    try:
+        dynamic_axes = {name: {0: "batch", 1: "tokens"} for name in input_names}
+        dynamic_axes["sentence_embedding"] = {0: "batch"}
+        torch.onnx.export(
+            SentenceEmbedding(), tuple(sample[name] for name in input_names), os.path.join(tmp_path, "model.onnx"),
+            input_names=input_names, output_names=["sentence_embedding"], dynamic_axes=dynamic_axes,
+            opset_version=17, dynamo=False
+        )
+        quantize_dynamic(os.path.join(tmp_path, "model.onnx"), os.path.join(tmp_path, "model.int8.onnx"),
+                         weight_type=QuantType.QInt8)
+        tokenizer.save_pretrained(tmp_path)
+        with open(os.path.join(tmp_path, "encoder.json"), "w") as f:
+            json.dump({
+                "model": model_name,
+                "input_names": input_names,
+                "max_seq_length": model.max_seq_length,
+                "pad_id": tokenizer.pad_token_id,
+                "pad_token": tokenizer.pad_token
+            }, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Lost the race to another process's export
+        if not os.path.exists(os.path.join(path, "encoder.json")):
+            raise
+    finally:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+    return path
+
+class OnnxEncoder:
+    """
+    Drop-in for SentenceTransformer.encode (numpy output) running an exported
+    graph on onnxruntime's CPU provider.
+
+        encoder = load_onnx_encoder("all-MiniLM-L6-v2")
+        encoder.encode(["Python", "Machine Learning"])  # (2, 384) float32
+    """
+
+    def __init__(self, path, quantize=True):
+        import onnxruntime
+        from tokenizers import Tokenizer
+        
+        with open(os.path.join(path, "encoder.json")) as f:
+            meta = json.load(f)
+        self.input_names = meta["input_names"]
+        self.tokenizer = Tokenizer.from_file(os.path.join(path, "tokenizer.json"))
+        self.tokenizer.enable_truncation(meta["max_seq_length"])
+        self.tokenizer.enable_padding(pad_id=meta["pad_id"], pad_token=meta["pad_token"])
+        
+        options = onnxruntime.SessionOptions()
+        if config.ONNX_THREADS:
+            options.intra_op_num_threads = config.ONNX_THREADS
+        graph = "model.int8.onnx" if quantize else "model.onnx"
+        self.session = onnxruntime.InferenceSession(os.path.join(path, graph), options,
+                                                    providers=["CPUExecutionProvider"])
+
+    def encode(self, sentences, batch_size=32, **kwargs):
+        """
+        Embeds a string or a list of strings. Like SentenceTransformer, texts
+        are batched by length so each batch pads as little as possible.
+        """
+        single = isinstance(sentences, str)
+        sentences = [sentences] if single else list(sentences)
+        order = np.argsort([-len(s) for s in sentences], kind="stable")
+        
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            encodings = self.tokenizer.encode_batch([sentences[i] for i in order[start:start + batch_size]])
+            feed = {
+                "input_ids": np.array([e.ids for e in encodings], dtype=np.int64),
+                "attention_mask": np.array([e.attention_mask for e in encodings], dtype=np.int64),
+                "token_type_ids": np.array([e.type_ids for e in encodings], dtype=np.int64)
+            }
+            batches.append(self.session.run(None, {name: feed[name] for name in self.input_names})[0])
+        if not batches:
+            return np.zeros((0, 0), dtype=np.float32)
+        
+        sorted_embeddings = np.concatenate(batches)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings[0] if single else embeddings
+
+def load_onnx_encoder(model_name, quantize=None):
+    """
+    ONNX encoder for a model, exporting it on first use.
+    """
+    quantize = config.ONNX_QUANTIZE if quantize is None else quantize
+    path = onnx_dir(model_name)
+    if not os.path.exists(os.path.join(path, "encoder.json")):
+        export_onnx(model_name, path)
+    return OnnxEncoder(path, quantize)
@@ -0,0 +1,280 @@
+import json
+import os
+import threading
+import time
+from functools import lru_cache
+from importlib import metadata
+
+from skillgap import config
+from skillgap.cache import TieredCache, content_key
+from skillgap.keywords import CERTS_DB, ROLES_DB, get_keyword_scanner
+from skillgap.results import SkillExtraction
+from skillgap.taxonomy import get_taxonomy
+from skillgap.text import iter_text_chunks
+
+
+# Bump whenever matching changes, so cached extractions are not reused
+EXTRACTION_VERSION = "2"
+
+# spaCy is imported on first model load, not at module import; categorization
+# and context detection never need it
+_MODEL_LOCK = threading.Lock()
+
+
+# --- EXTRACTOR LOGIC (Formerly src/extractor.py) ---
+def load_model(mode=None):
+    """
+    Loads the spaCy pipeline once per process and mode.
+
+    "fast" is a blank English tokenizer plus the compiled skill matcher, which
+    is all skill extraction reads; "full" is the pretrained pipeline with the
+    matcher in front of NER. Defaults to config.EXTRACTION_MODE. Concurrent
+    callers (e.g. a page and the background warm-up) wait for the same load.
+    """
+    with _MODEL_LOCK:
+        return _load_model(mode or config.EXTRACTION_MODE)
+
+@lru_cache(maxsize=None)
+def _load_model(mode):
+    import spacy
+    import skillgap.matcher  # noqa: F401 (registers the skill_matcher factory)
+    
+    if mode == "fast":
+        model = spacy.blank("en")
+        model.add_pipe("skill_matcher")
+        return model
+    
+    try:
+        model = spacy.load("en_core_web_lg")
+    except OSError:
+        model = spacy.load("en_core_web_sm")
+    
+    # Add skill matcher
+    if "skill_matcher" not in model.pipe_names:
+        model.add_pipe("skill_matcher", before="ner")
+    return model
+
+@lru_cache(maxsize=1)
+def get_extraction_cache():
+    """
+    Process-wide cache of extraction results, shared by every session.
+    """
+    db_path = os.path.join(config.CACHE_DIR, "extraction_cache.sqlite3") if config.EXTRACT_CACHE_DISK else None
+    return TieredCache("extractions", max_items=config.EXTRACT_CACHE_SIZE, db_path=db_path,
+                       ttl=config.EXTRACT_CACHE_TTL or None, max_disk_items=config.EXTRACT_CACHE_DISK_ITEMS or None)
+
+@lru_cache(maxsize=None)
+def model_name(mode=None):
+    """
+    Identifies the pipeline a mode resolves to, without loading (or even
+    importing) spaCy.
+    """
+    mode = mode or config.EXTRACTION_MODE
+    if mode == "fast":
+        return f"blank_en-{metadata.version('spacy')}"
+    for package in ("en_core_web_lg", "en_core_web_sm"):
+        try:
+            return f"{package}-{metadata.version(package)}"
+        except metadata.PackageNotFoundError:
+            pass
+    return "en_core_web_sm"
+
+def extraction_cache_key(text, mode=None):
+    return content_key(text, "extraction", EXTRACTION_VERSION, get_taxonomy().version, model_name(mode))
+
+def _doc_extraction(doc):
+    return SkillExtraction.from_doc(doc, get_taxonomy())
+
+def _is_long(text):
+    return len(text) > config.EXTRACT_CHUNK_CHARS > 0
+
+def _extract_chunked(nlp_model, text):
+    """
+    Streams a long text through the pipeline one chunk at a time, so only a
+    single chunk's Doc is alive at once, and merges the spans back into
+    document offsets.
+    """
+    result = SkillExtraction(get_taxonomy().version)
+    chunks = ((chunk, offset) for offset, chunk in iter_text_chunks(text, config.EXTRACT_CHUNK_CHARS))
+    for doc, offset in nlp_model.pipe(chunks, batch_size=1, as_tuples=True):
+        result.extend(_doc_extraction(doc), offset)
+    return result
+
+def _extract_text(nlp_model, text):
+    if _is_long(text):
+        return _extract_chunked(nlp_model, text)
+    return _doc_extraction(nlp_model(text))
+
+def extract_skill_details(text, mode=None):
+    """
+    Extracts every skill occurrence (canonical ID, character span) from text.
+    Results are cached per (text, taxonomy version, model).
+    """
+    def compute():
+        return _extract_text(load_model(mode), text).to_dict()
+    return SkillExtraction.from_dict(get_extraction_cache().get_or_compute(extraction_cache_key(text, mode), compute))
+
+def extract_skills_from_text(text, mode=None):
+    """
+    Extracts skills from text using Spacy + the compiled skill matcher.
+    """
+    return extract_skill_details(text, mode).skills()
+
+def iter_extract_details(texts, mode=None, batch_size=None, n_process=None, as_tuples=False):
+    """
+    Streams texts through nlp.pipe and yields a SkillExtraction per document
+    in input order. With as_tuples=True, takes (text, context) pairs and
+    yields (extraction, context), so callers can carry their own data.
+
+    Texts already in the extraction cache skip the pipeline (an empty text
+    holds their place in the stream), and long texts are extracted chunk by
+    chunk on their own. Defaults to config.EXTRACT_BATCH_SIZE and
+    config.EXTRACT_PROCESSES.
+    """
+    cache = get_extraction_cache()
+    nlp_model = load_model(mode)
+    
+    def lookups():
+        for item in texts:
+            text, context = item if as_tuples else (item, None)
+            key = extraction_cache_key(text, mode)
+            cached = cache.get(key)
+            if cached is None and _is_long(text):
+                cached = _extract_chunked(nlp_model, text).to_dict()
+                cache.put(key, cached)
+            yield ("" if cached is not None else text), (key, cached, context)
+    
+    docs = nlp_model.pipe(lookups(),
+                          batch_size=batch_size or config.EXTRACT_BATCH_SIZE,
+                          n_process=n_process or config.EXTRACT_PROCESSES,
+                          as_tuples=True)
+    for doc, (key, cached, context) in docs:
+        if cached is None:
+            extraction = _doc_extraction(doc)
+            cache.put(key, extraction.to_dict())
+        else:
+            extraction = SkillExtraction.from_dict(cached)
+        yield (extraction, context) if as_tuples else extraction
+
+def iter_extract_skills(texts, mode=None, batch_size=None, n_process=None, as_tuples=False):
+    """
+    Like iter_extract_details, but yields each document's sorted skill names.
+    """
+    for item in iter_extract_details(texts, mode, batch_size, n_process, as_tuples):
+        yield (item[0].skills(), item[1]) if as_tuples else item.skills()
+
+def extract_batch(texts, mode=None, batch_size=None, n_process=None):
+    """
+    Extracts skills from many texts in one nlp.pipe pass.
+    Returns (SkillExtraction per text in input order, throughput stats).
+
+    Only cache misses are run through the pipeline, so the model is not even
+    loaded when every text is cached.
+    """
+    start = time.perf_counter()
+    cache = get_extraction_cache()
+    texts = list(texts)
+    keys = [extraction_cache_key(text, mode) for text in texts]
+    cached = [cache.get(key) for key in keys]
+    results = [SkillExtraction.from_dict(data) if data is not None else None for data in cached]
+    misses = [i for i, extraction in enumerate(results) if extraction is None]
+    
+    if misses:
+        nlp_model = load_model(mode)
+        short = [i for i in misses if not _is_long(texts[i])]
+        docs = nlp_model.pipe((texts[i] for i in short),
+                              batch_size=batch_size or config.EXTRACT_BATCH_SIZE,
+                              n_process=n_process or config.EXTRACT_PROCESSES)
+        for i, doc in zip(short, docs):
+            results[i] = _doc_extraction(doc)
+        for i in misses:
+            if results[i] is None:
+                results[i] = _extract_chunked(nlp_model, texts[i])
+            cache.put(keys[i], results[i].to_dict())
+    
+    seconds = time.perf_counter() - start
+    stats = {
+        "docs": len(results),
+        "cache_hits": len(results) - len(misses),
+        "seconds": seconds,
+        "docs_per_sec": len(results) / max(seconds, 1e-9)
+    }
+    return results, stats
+
+def extract_segments_batch(documents, mode=None, batch_size=None, n_process=None):
+    """
+    extract_batch for documents given as (offset, text) segments (see
+    sections.extraction_text). All segments go through one batch; each
+    document's result has spans relative to its original text.
+    """
+    documents = [list(segments) for segments in documents]
+    extractions, stats = extract_batch([text for segments in documents for _, text in segments],
+                                       mode, batch_size, n_process)
+    parts = iter(extractions)
+    results = []
+    for segments in documents:
+        result = SkillExtraction(get_taxonomy().version)
+        for offset, _ in segments:
+            result.extend(next(parts), offset)
+        results.append(result)
+    return results, stats
+
+def extract_skills_batch(texts, mode=None, batch_size=None, n_process=None):
+    """
+    Like extract_batch, but returns each text's sorted skill names.
+    """
+    results, stats = extract_batch(texts, mode, batch_size, n_process)
+    return [extraction.skills() for extraction in results], stats
+
+def extract_context(text):
+    """
+    Keyword based detection of job roles and certifications.
+    Results are cached per text.
+    """
+    key = content_key(text, "context", context_version())
+    return get_extraction_cache().get_or_compute(key, lambda: _extract_context(text))
+
+@lru_cache(maxsize=1)
+def context_version():
+    # Changes whenever the role or certification keywords do
+    return content_key(json.dumps([ROLES_DB, CERTS_DB]))[:16]
+
+def _extract_context(text):
+    found = get_keyword_scanner().scan(text)
+    context = {"roles": [], "certs": []}
+    
+    # Common Role Keywords (reported in ROLES_DB order)
+    roles = found.get("role", ())
+    for r in ROLES_DB:
+        if r in roles:
+            context["roles"].append(r.title())
+            
+    # Common Cert Keywords
+    certs = found.get("cert", ())
+    for c in CERTS_DB:
+        if c in certs:
+            context["certs"].append(c.upper() if len(c) < 5 else c.title())
+            
+    return context
+
+def categorize_skills(skills_list):
+    """
+    Simple rule-based categorization for visualization.
+    """
+    categories = {
+        "Technical": [],
+        "Soft Skills": [],
+        "Tools/Frameworks": []
+    }
+    
+    scanner = get_keyword_scanner()
+    for skill in skills_list:
+        found = scanner.scan(skill)
+        if "soft" in found:
+            categories["Soft Skills"].append(skill)
+        elif "tools" in found:
+            categories["Tools/Frameworks"].append(skill)
+        else:
+            categories["Technical"].append(skill)
+            
+    return categories
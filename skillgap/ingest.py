@@ -0,0 +1,180 @@
+import hashlib
+import os
+import tempfile
+from contextlib import nullcontext
+
+from skillgap import config
+from skillgap.cache import content_key, digest_key
+from skillgap.parser import file_extension, get_parse_cache, is_parse_error, parse_bytes, parser_signature, pdf_total_pages
+from skillgap.quality import analyze_resume_quality
+from skillgap.sections import segment_sections
+from skillgap.text import normalize_text
+from skillgap.timing import StageTimer, track_process_memory
+
+
+class UploadLimitError(ValueError):
+    """
+    Raised when an upload exceeds config.MAX_UPLOAD_BYTES / MAX_UPLOAD_PAGES.
+    """
+
+
+def check_upload_size(size):
+    if config.MAX_UPLOAD_BYTES and size > config.MAX_UPLOAD_BYTES:
+        raise UploadLimitError(f"File is too large ({size / 1e6:.1f} MB, limit {config.MAX_UPLOAD_BYTES / 1e6:.1f} MB).")
+
+def check_page_limit(pages):
+    if config.MAX_UPLOAD_PAGES and pages > config.MAX_UPLOAD_PAGES:
+        raise UploadLimitError(f"Document has too many pages ({pages}, limit {config.MAX_UPLOAD_PAGES}).")
+
+def _new_result(name, size):
+    return {"name": name, "text": "", "sections": [], "error": None, "cached": False,
+            "bytes": size, "pages": None, "total_pages": None, "truncated": False, "quality": None,
+            "memory": None, "stages": []}
+
+def ingest_error(name, error, size=None):
+    """
+    An ingest_bytes-shaped result for a document rejected before parsing.
+    """
+    result = _new_result(name, size)
+    result["error"] = error
+    return result
+
+
+# --- INGESTION PIPELINE ---
+def ingest_bytes(source, name, cache=None, check_quality=False, digest=None, size=None):
+    """
+    Validates, parses, normalizes, segments and optionally quality-checks one
+    document, timing every stage. Normalized text goes through the
+    content-addressed parse cache.
+
+    `source` is bytes, a memoryview or a path to a spilled upload; for paths
+    pass the precomputed SHA-256 `digest` and `size`.
+
+    Returns a dict with "text" (layout preserved), "sections" (see
+    segment_sections), "error", "cached", "bytes", "pages" (parsed) and
+    "total_pages" for PDFs, "truncated" (True when the PDF page or character
+    budget cut the text short), "quality" ((score, issues) or None) and
+    "stages" (see StageTimer).
+    """
+    cache = cache or get_parse_cache()
+    size = len(source) if size is None else size
+    result = _new_result(name, size)
+    timer = StageTimer()
+    result["stages"] = timer.stages
+    file_type = file_extension(name)
+    
+    try:
+        with timer.stage("parse") as stage:
+            check_upload_size(size)
+            signature = parser_signature()
+            key = digest_key(digest, file_type, signature) if digest else content_key(source, file_type, signature)
+            parsed = cache.get(key)
+            result["cached"] = stage["cached"] = parsed is not None
+            if parsed is None:
+                parsed = {"pages": None, "total_pages": None, "truncated": False}
+                if file_type == "pdf":
+                    try:
+                        total_pages = pdf_total_pages(source)
+                    except Exception:
+                        total_pages = None  # unreadable; parse_bytes reports the error
+                    if total_pages is not None:
+                        budget = config.PDF_MAX_PAGES
+                        parsed["total_pages"] = total_pages
+                        parsed["pages"] = stage["pages"] = min(total_pages, budget) if budget else total_pages
+            # The page count is cached with the text, so the limit (not part
+            # of the cache key) holds for cache hits too
+            if parsed["total_pages"] is not None:
+                check_page_limit(parsed["total_pages"])
+            if "text" not in parsed:
+                content = parse_bytes(source, file_type)
+    except UploadLimitError as e:
+        result["error"] = str(e)
+        return result
+    
+    if "text" not in parsed:
+        if is_parse_error(content):
+            result["error"] = content or "Empty document."
+            return result
+        if file_type == "pdf":
+            # The character budget cuts extraction off at exactly PDF_MAX_CHARS
+            cut_chars = bool(config.PDF_MAX_CHARS) and len(content) >= config.PDF_MAX_CHARS
+            parsed["truncated"] = cut_chars or (parsed["pages"] or 0) < (parsed["total_pages"] or 0)
+        with timer.stage("normalize", chars=len(content)):
+            parsed["text"] = normalize_text(content)
+        cache.put(key, parsed)
+    result.update(parsed)
+    text = parsed["text"]
+    
+    with timer.stage("segment") as stage:
+        result["sections"] = segment_sections(text)
+        stage["sections"] = len(result["sections"])
+    
+    if check_quality:
+        with timer.stage("quality check"):
+            result["quality"] = analyze_resume_quality(text, result["sections"])
+    return result
+
+def _upload_size(uploaded_file):
+    size = getattr(uploaded_file, "size", None)
+    if size is None:
+        position = uploaded_file.tell()
+        size = uploaded_file.seek(0, os.SEEK_END)
+        uploaded_file.seek(position)
+    return size
+
+def _ingest_spilled(uploaded_file, size, timer, cache, check_quality):
+    # Copy to a temp file in chunks, hashing on the way, and parse from disk
+    suffix = "." + file_extension(uploaded_file.name)
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+        with timer.stage("read", bytes=size, spilled=True):
+            digest = hashlib.sha256()
+            uploaded_file.seek(0)
+            for chunk in iter(lambda: uploaded_file.read(1024 * 1024), b""):
+                digest.update(chunk)
+                tmp.write(chunk)
+    try:
+        return ingest_bytes(tmp.name, uploaded_file.name, cache, check_quality, digest=digest.hexdigest(), size=size)
+    finally:
+        os.unlink(tmp.name)
+
+def _ingest_upload(uploaded_file, cache, check_quality):
+    size = _upload_size(uploaded_file)
+    try:
+        check_upload_size(size)
+    except UploadLimitError as e:
+        result = _new_result(uploaded_file.name, size)
+        result["error"] = str(e)
+        return result
+    
+    timer = StageTimer()
+    if config.SPILL_TO_DISK_BYTES and size >= config.SPILL_TO_DISK_BYTES and file_extension(uploaded_file.name) != "txt":
+        result = _ingest_spilled(uploaded_file, size, timer, cache, check_quality)
+    elif hasattr(uploaded_file, "getbuffer"):
+        # In-memory uploads (e.g. Streamlit's UploadedFile) are parsed through a
+        # memoryview of their buffer instead of a copy
+        with timer.stage("read", bytes=size):
+            view = uploaded_file.getbuffer()
+        with view:
+            result = ingest_bytes(view, uploaded_file.name, cache, check_quality, size=size)
+    else:
+        with timer.stage("read", bytes=size):
+            file_bytes = uploaded_file.read()
+        result = ingest_bytes(file_bytes, uploaded_file.name, cache, check_quality, size=size)
+    
+    result["stages"][:0] = timer.stages
+    return result
+
+def ingest_document(uploaded_file, cache=None, check_quality=False, track_memory=None):
+    """
+    ingest_bytes for an uploaded file. The byte limit is checked before
+    anything is read; large uploads are spilled to disk, smaller in-memory
+    ones are parsed zero-copy. With `track_memory` (default
+    config.TRACK_MEMORY) process memory around the ingestion is reported as
+    "memory" (see track_process_memory).
+    """
+    if track_memory is None:
+        track_memory = config.TRACK_MEMORY
+    with (track_process_memory() if track_memory else nullcontext(None)) as memory:
+        result = _ingest_upload(uploaded_file, cache, check_quality)
+    result["memory"] = memory
+    return result
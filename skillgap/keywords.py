@@ -0,0 +1,78 @@
+from functools import lru_cache
+
+# --- KEYWORD LISTS ---
+# Resume section headers checked by `analyze_resume_quality`
+SECTION_KEYWORDS = ["education", "experience", "skills", "projects"]
+
+# Role and certification keywords used by `extract_context`
+ROLES_DB = ["data scientist", "data analyst", "software engineer", "manager", "developer", "architect", "consultant", "intern"]
+CERTS_DB = ["pmp", "aws certified", "azure fundamentals", "scrum master", "cissp", "google data analytics", "ibm data science"]
+
+# Category keywords used by `categorize_skills`
+SOFT_KEYWORDS = ["Communication", "Teamwork", "Leadership", "Problem Solving", "Critical Thinking", "Agile", "Scrum", "Management", "Adaptability", "Creativity"]
+TOOLS_KEYWORDS = ["Jira", "Git", "GitHub", "Docker", "Kubernetes", "AWS", "Azure", "Tableau", "Excel", "Power BI", "Figma", "React", "Angular", "Vue", "Django", "Flask"]
+
+
+class KeywordScanner:
+    """
+    Case-insensitive, word-bounded keyword search.
+
+    Each keyword is located with str.find (a C substring search) over the
+    lowercased text; only its hits are checked for word boundaries in
+    Python, so a scan costs about as much as plain `in` tests. Overlapping
+    matches of different keywords are all reported.
+    """
+
+    def __init__(self, keywords):
+        """
+        `keywords` is an iterable of (kind, keyword) pairs.
+        """
+        self._keywords = [(kind, keyword, keyword.lower()) for kind, keyword in keywords]
+
+    @staticmethod
+    def _iter_bounded(text, needle):
+        # Start offsets of the word-bounded occurrences of `needle`
+        size = len(needle)
+        start = text.find(needle)
+        while start != -1:
+            end = start + size
+            if (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum()):
+                yield start
+            start = text.find(needle, start + 1)
+
+    def iter_matches(self, text):
+        """
+        Yields (kind, keyword, start, end) for every word-bounded match, in
+        text order.
+        """
+        text = text.lower()
+        matches = []
+        for kind, keyword, needle in self._keywords:
+            matches.extend((start, start + len(needle), kind, keyword) for start in self._iter_bounded(text, needle))
+        for start, end, kind, keyword in sorted(matches):
+            yield kind, keyword, start, end
+
+    def scan(self, text):
+        """
+        Maps each keyword kind to the set of its keywords found in `text`.
+        Stops searching for a keyword at its first word-bounded hit.
+        """
+        text = text.lower()
+        found = {}
+        for kind, keyword, needle in self._keywords:
+            if next(self._iter_bounded(text, needle), None) is not None:
+                found.setdefault(kind, set()).add(keyword)
+        return found
+
+
+@lru_cache(maxsize=None)
+def get_keyword_scanner():
+    """
+    The shared scanner over section, role, cert and category keywords.
+    """
+    keywords = [("section", k) for k in SECTION_KEYWORDS]
+    keywords += [("role", k) for k in ROLES_DB]
+    keywords += [("cert", k) for k in CERTS_DB]
+    keywords += [("soft", k) for k in SOFT_KEYWORDS]
+    keywords += [("tools", k) for k in TOOLS_KEYWORDS]
+    return KeywordScanner(keywords)
@@ -0,0 +1,195 @@
+import json
+import os
+import threading
+
+import spacy
+from spacy.language import Language
+from spacy.tokens import Span
+
+from skillgap import config
+from skillgap.cache import content_key
+from skillgap.taxonomy import get_taxonomy
+
+# Bump when the on-disk index layout changes
+MATCHER_VERSION = "2"
+
+
+# --- SKILL MATCHER ---
+class SkillMatcher:
+    """
+    Compiled token trie over a skill taxonomy.
+
+    Every canonical name and alias is tokenized with the pipeline's own
+    tokenizer, so multi-word ("Machine Learning") and tokenizer-split
+    ("CI/CD", "Node.js") skills match exactly as they appear in text. Matching
+    is a single left-to-right pass over the tokens of a document regardless
+    of how many terms are indexed; every match resolves to the skill's
+    integer ID and canonical name.
+
+    The trie is kept flat so it stays small at 50k+ terms: token strings map
+    to integer IDs, and edges live in one dict keyed by (node << 32 | token).
+    """
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.tokens = {}     # lowercased token -> token id
+        self.edges = {}      # node << 32 | token id -> child node
+        self.terminals = {}  # node -> skill id
+        self.exact = {}      # node -> original-case tokens, for case-sensitive terms
+        self._node_count = 1  # node 0 is the root
+
+    def add(self, skill_id, tokens, case_sensitive=False):
+        node = 0
+        for token in tokens:
+            token_id = self.tokens.setdefault(token.lower(), len(self.tokens))
+            key = node << 32 | token_id
+            child = self.edges.get(key)
+            if child is None:
+                child = self.edges[key] = self._node_count
+                self._node_count += 1
+            node = child
+        if node not in self.terminals:
+            self.terminals[node] = skill_id
+            if case_sensitive:
+                self.exact[node] = tuple(tokens)
+
+    def match_tokens(self, texts):
+        """
+        Returns (skill_id, start, end) for the leftmost-longest,
+        non-overlapping matches in a list of token strings.
+        """
+        token_ids = [self.tokens.get(text.lower(), -1) for text in texts]
+        matches = []
+        i = 0
+        while i < len(texts):
+            node = 0
+            best = None
+            for j in range(i, len(texts)):
+                if token_ids[j] < 0:
+                    break
+                node = self.edges.get(node << 32 | token_ids[j])
+                if node is None:
+                    break
+                if node in self.terminals and (node not in self.exact or self.exact[node] == tuple(texts[i:j + 1])):
+                    best = (self.terminals[node], i, j + 1)
+            if best:
+                matches.append(best)
+                i = best[2]
+            else:
+                i += 1
+        return matches
+
+    def match(self, doc):
+        """
+        match_tokens over a Doc, returning token indices into it. Whitespace
+        tokens (line breaks, runs of spaces) are skipped, so a skill wrapped
+        across lines still matches.
+        """
+        indices = [token.i for token in doc if not token.is_space]
+        matches = self.match_tokens([doc[i].text for i in indices])
+        return [(skill_id, indices[start], indices[end - 1] + 1) for skill_id, start, end in matches]
+
+    def __call__(self, doc):
+        """
+        Returns SKILL spans with the canonical skill name as the span's kb_id.
+        """
+        return [Span(doc, start, end, label="SKILL", kb_id=self.names[skill_id])
+                for skill_id, start, end in self.match(doc)]
+
+    @classmethod
+    def compile(cls, nlp, taxonomy):
+        """
+        Tokenizes every term of `taxonomy` and builds the trie.
+        """
+        matcher = cls(taxonomy.names)
+        terms = list(taxonomy.terms())
+        docs = nlp.tokenizer.pipe(term for term, _ in terms)
+        for (term, skill_id), doc in zip(terms, docs):
+            matcher.add(skill_id, [token.text for token in doc], term in taxonomy.case_sensitive)
+        return matcher
+
+    def to_disk(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".json", "w", encoding="utf-8") as f:
+            json.dump({
+                "names": self.names,
+                "tokens": list(self.tokens),
+                "edges": [list(self.edges), list(self.edges.values())],
+                "terminals": [list(self.terminals), list(self.terminals.values())],
+                "exact": [[node, list(tokens)] for node, tokens in self.exact.items()]
+            }, f)
+
+    @classmethod
+    def from_disk(cls, path):
+        with open(path + ".json", encoding="utf-8") as f:
+            data = json.load(f)
+        matcher = cls(data["names"])
+        matcher.tokens = {token: token_id for token_id, token in enumerate(data["tokens"])}
+        matcher.edges = dict(zip(*data["edges"]))
+        matcher.terminals = dict(zip(*data["terminals"]))
+        matcher.exact = {node: tuple(tokens) for node, tokens in data["exact"]}
+        matcher._node_count = len(matcher.edges) + 1
+        return matcher
+
+
+def index_path(nlp, taxonomy):
+    """
+    On-disk location of the compiled index for this taxonomy and tokenizer.
+    """
+    key = content_key(taxonomy.version, nlp.lang, nlp.meta.get("name", ""), spacy.__version__, MATCHER_VERSION)
+    return os.path.join(config.CACHE_DIR, "matcher", "skills-" + key.split(":")[0][:16])
+
+def load_skill_matcher(nlp, taxonomy=None):
+    """
+    Loads the compiled index from disk, building and saving it on first use.
+    Defaults to the active taxonomy.
+    """
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    path = index_path(nlp, taxonomy)
+    if os.path.exists(path + ".json"):
+        try:
+            return SkillMatcher.from_disk(path)
+        except (OSError, ValueError, KeyError):
+            pass  # stale or partial index; rebuild below
+    
+    matcher = SkillMatcher.compile(nlp, taxonomy)
+    try:
+        matcher.to_disk(path)
+    except OSError:
+        pass  # read-only cache dir: keep the in-memory index
+    return matcher
+
+
+@Language.factory("skill_matcher")
+def create_skill_matcher(nlp, name):
+    return SkillMatcherComponent(nlp)
+
+
+class SkillMatcherComponent:
+    """
+    Pipeline component that sets the matched skills as SKILL entities.
+
+    It follows the active taxonomy: after reload_taxonomy() the next document
+    swaps in the matcher for the new version (compiled or read from disk),
+    with no pipeline reload.
+    """
+
+    def __init__(self, nlp):
+        self.nlp = nlp
+        self.taxonomy = get_taxonomy()
+        self.matcher = load_skill_matcher(nlp, self.taxonomy)
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        taxonomy = get_taxonomy()
+        if taxonomy is not self.taxonomy:
+            with self._lock:
+                if taxonomy is not self.taxonomy:
+                    self.matcher = load_skill_matcher(self.nlp, taxonomy)
+                    self.taxonomy = taxonomy
+        return self.matcher
+
+    def __call__(self, doc):
+        doc.ents = self.refresh()(doc)
+        return doc
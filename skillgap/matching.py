@@ -0,0 +1,57 @@
+import numpy as np
+
+
+# --- VECTORIZED MATCHING ---
+def normalize_rows(matrix):
+    """
+    L2-normalizes each row (as float32), so dot products are cosines.
+    Accepts numpy arrays, lists or CPU/GPU torch tensors.
+    """
+    if hasattr(matrix, "detach"):
+        matrix = matrix.detach().cpu().numpy()
+    matrix = np.asarray(matrix, dtype=np.float32)
+    return matrix / np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+
+def best_matches(resume_embeddings, jd_embeddings):
+    """
+    For every JD skill, the index of the closest resume skill and its cosine
+    similarity: one matrix product and one argmax over the (jd x resume)
+    score matrix.
+    """
+    scores = normalize_rows(jd_embeddings) @ normalize_rows(resume_embeddings).T
+    best = scores.argmax(axis=1)
+    return best, scores[np.arange(len(best)), best]
+
+def batch_best_matches(resume_batch, jd_batch):
+    """
+    Best matches for every (JD, resume) pair of two batches, from a single
+    matrix product over all skills.
+
+    `resume_batch` and `jd_batch` are lists of per-document embedding
+    matrices. Returns one (best_idx, best_scores) pair per JD, each of shape
+    (jd skills, resumes): the index into that resume's skills and the cosine.
+    Resumes without skills score -inf.
+    """
+    if not len(resume_batch):
+        return [(np.zeros((len(e), 0), dtype=int), np.zeros((len(e), 0), dtype=np.float32)) for e in jd_batch]
+    resume_lengths = np.array([len(e) for e in resume_batch])
+    jd_lengths = [len(e) for e in jd_batch]
+    dim = next((np.shape(e)[1] for e in list(resume_batch) + list(jd_batch) if len(e)), 1)
+    resumes = np.concatenate([normalize_rows(e).reshape(-1, dim) for e in resume_batch])
+    jds = np.concatenate([normalize_rows(e).reshape(-1, dim) for e in jd_batch])
+
+    # (all jd skills) x (all resume skills), plus a -inf column for padding
+    scores = jds @ resumes.T
+    scores = np.concatenate([scores, np.full((len(jds), 1), -np.inf, dtype=scores.dtype)], axis=1)
+
+    # Gather each resume's columns into a padded (resumes x longest) block
+    width = max(int(resume_lengths.max(initial=0)), 1)
+    offsets = np.concatenate([[0], np.cumsum(resume_lengths)[:-1]]).astype(int)
+    positions = np.arange(width)
+    columns = np.where(positions < resume_lengths[:, None], offsets[:, None] + positions, len(resumes))
+    grouped = scores[:, columns]  # jd skills x resumes x width
+
+    best = grouped.argmax(axis=2)
+    best_scores = np.take_along_axis(grouped, best[..., None], axis=2)[..., 0]
+    splits = np.cumsum(jd_lengths)[:-1]
+    return list(zip(np.split(best, splits), np.split(best_scores, splits)))
@@ -0,0 +1,308 @@
+import io
+import multiprocessing
+import os
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import pymupdf as fitz  # PyMuPDF; the legacy "fitz" module prints a deprecation notice on import
+import docx
+
+from skillgap import config
+from skillgap.cache import TieredCache
+
+# Extensions accepted by the uploaders and the CLI
+SUPPORTED_EXTENSIONS = ("pdf", "docx", "txt")
+
+# Bump whenever parser output changes, so cached text is not reused
+PARSER_VERSION = "5"
+
+# WordprocessingML tags read by the streaming DOCX extractor
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_DOCX_PARAGRAPH = _W + "p"
+_DOCX_TEXT = _W + "t"
+_DOCX_TAB = _W + "tab"
+_DOCX_BREAKS = (_W + "br", _W + "cr")
+# Text boxes are stored twice (DrawingML + VML fallback); only the first copy is read
+_DOCX_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+
+# --- PARSING LOGIC (Formerly src/parser.py) ---
+def open_pdf(source):
+    """
+    Opens a PDF from bytes / memoryview, or from a path without reading it
+    into memory first.
+    """
+    if isinstance(source, str):
+        return fitz.open(source, filetype="pdf")
+    return fitz.open(stream=source, filetype="pdf")
+
+def iter_pdf_pages(source, max_pages=None, max_chars=None):
+    """
+    Yields the text of each PDF page in order, stopping early once `max_pages`
+    pages or `max_chars` characters have been produced. `source` is anything
+    open_pdf accepts.
+
+    The document is closed as soon as the generator finishes, or when it is
+    closed / garbage collected by a consumer that stops early.
+    """
+    with open_pdf(source) as doc:
+        page_count = doc.page_count
+        if max_pages:
+            page_count = min(page_count, max_pages)
+        
+        remaining = max_chars
+        for page_number in range(page_count):
+            text = doc.load_page(page_number).get_text()
+            if remaining:
+                if len(text) >= remaining:
+                    yield text[:remaining]
+                    return
+                remaining -= len(text)
+            yield text
+
+# Document (bytes or path) of the current parallel extraction, set once per worker process
+_worker_pdf_source = None
+
+def _init_pdf_worker(source):
+    global _worker_pdf_source
+    _worker_pdf_source = source
+
+def _extract_page_range(page_range):
+    start, stop = page_range
+    with open_pdf(_worker_pdf_source) as doc:
+        return "".join(doc.load_page(i).get_text() for i in range(start, stop))
+
+def split_page_ranges(page_count, parts):
+    """
+    Splits [0, page_count) into at most `parts` contiguous (start, stop) ranges.
+    """
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    ranges = []
+    start = 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+def pdf_total_pages(source):
+    """
+    Number of pages in a PDF, read without extracting any text.
+    """
+    with open_pdf(source) as doc:
+        return doc.page_count
+
+def pdf_page_count(source):
+    """
+    Number of pages a PDF will be parsed for, after the page budget.
+    """
+    page_count = pdf_total_pages(source)
+    return min(page_count, config.PDF_MAX_PAGES) if config.PDF_MAX_PAGES else page_count
+
+def pdf_pool_context():
+    """
+    Start method for the PDF process pool: forkserver where available, else
+    spawn. Forking the app would copy its threads (Streamlit, torch) and
+    their locks into the workers.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+def parse_pdf_parallel(source, page_count, workers=None):
+    """
+    Extracts the first `page_count` pages on a process pool. Each worker
+    receives the document (bytes, or just the path for spilled uploads) once
+    and opens its own copy; page ranges are reassembled in order.
+    """
+    workers = workers or config.PDF_WORKERS
+    ranges = split_page_ranges(page_count, workers)
+    if isinstance(source, memoryview):
+        source = source.tobytes()  # memoryviews can't be sent to worker processes
+    with ProcessPoolExecutor(max_workers=len(ranges), mp_context=pdf_pool_context(),
+                             initializer=_init_pdf_worker, initargs=(source,)) as pool:
+        return "".join(pool.map(_extract_page_range, ranges))
+
+def parse_pdf(source, max_pages=None, max_chars=None, parallel=None):
+    """
+    Extracts text from a PDF file (provided as bytes, a memoryview or a path).
+
+    The page and character budgets default to config.PDF_MAX_PAGES and
+    config.PDF_MAX_CHARS (0 means unlimited). With `parallel=None` the
+    process pool is used for documents of config.PDF_PARALLEL_MIN_PAGES
+    pages or more; the character budget is then applied after extraction.
+    """
+    if max_pages is None:
+        max_pages = config.PDF_MAX_PAGES
+    if max_chars is None:
+        max_chars = config.PDF_MAX_CHARS
+    try:
+        page_count = pdf_total_pages(source)
+        if max_pages:
+            page_count = min(page_count, max_pages)
+        
+        if parallel is None:
+            parallel = bool(config.PDF_PARALLEL_MIN_PAGES) and page_count >= config.PDF_PARALLEL_MIN_PAGES
+        if parallel and config.PDF_WORKERS > 1:
+            text = parse_pdf_parallel(source, page_count)
+            return text[:max_chars] if max_chars else text
+        
+        return "".join(iter_pdf_pages(source, page_count, max_chars))
+    except Exception as e:
+        return f"Error parsing PDF: {str(e)}"
+
+def _docx_parts(names):
+    """
+    Orders the text-bearing parts of a DOCX package: headers, body, footers.
+    """
+    headers = sorted(n for n in names if re.fullmatch(r"word/header\d*\.xml", n))
+    footers = sorted(n for n in names if re.fullmatch(r"word/footer\d*\.xml", n))
+    return headers + ["word/document.xml"] + footers
+
+def _iter_xml_paragraphs(xml_file):
+    # Each open paragraph collects its own runs, so text box paragraphs nested
+    # inside a body paragraph come out as separate lines
+    open_paragraphs = []
+    fallback_depth = 0
+    for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            if tag == _DOCX_FALLBACK:
+                fallback_depth += 1
+            elif tag == _DOCX_PARAGRAPH and not fallback_depth:
+                open_paragraphs.append([])
+            continue
+        
+        if tag == _DOCX_FALLBACK:
+            fallback_depth -= 1
+        elif fallback_depth or not open_paragraphs:
+            continue
+        elif tag == _DOCX_TEXT:
+            open_paragraphs[-1].append(elem.text or "")
+        elif tag == _DOCX_TAB:
+            open_paragraphs[-1].append("\t")
+        elif tag in _DOCX_BREAKS:
+            open_paragraphs[-1].append("\n")
+        elif tag == _DOCX_PARAGRAPH:
+            yield "".join(open_paragraphs.pop())
+            elem.clear()
+
+def iter_docx_paragraphs(file):
+    """
+    Streams paragraph text out of a DOCX (a path or binary file object)
+    without building the python-docx object model.
+
+    Yields header, body and footer paragraphs in document order, including
+    paragraphs inside table cells and text boxes.
+    """
+    with zipfile.ZipFile(file) as package:
+        names = set(package.namelist())
+        for part in _docx_parts(names):
+            if part in names:
+                with package.open(part) as xml_file:
+                    yield from _iter_xml_paragraphs(xml_file)
+
+def parse_docx(file, backend=None):
+    """
+    Extracts text from a DOCX file.
+
+    `backend` is "stream" (see iter_docx_paragraphs) or "python-docx", which
+    only reads body paragraphs; defaults to config.DOCX_BACKEND.
+    """
+    backend = backend or config.DOCX_BACKEND
+    try:
+        if backend == "stream":
+            return "\n".join(iter_docx_paragraphs(file))
+        doc = docx.Document(file)
+        text = "\n".join([para.text for para in doc.paragraphs])
+        return text
+    except Exception as e:
+        return f"Error parsing DOCX: {str(e)}"
+
+def parse_txt(source):
+    """
+    Extracts text from a TXT file (provided as bytes, a memoryview or a path).
+    """
+    try:
+        if isinstance(source, str):
+            with open(source, encoding="utf-8") as f:
+                return f.read()
+        return str(source, "utf-8")
+    except Exception as e:
+        return f"Error parsing TXT: {str(e)}"
+
+def file_extension(name):
+    """
+    Returns the lowercased extension of a file name, without the dot.
+    """
+    return name.split(".")[-1].lower()
+
+def parse_bytes(source, file_type):
+    """
+    Parses a document of the given type ("pdf", "docx" or "txt") from raw
+    bytes, a memoryview or a path on disk.
+    """
+    if file_type == "pdf":
+        return parse_pdf(source)
+    elif file_type == "docx":
+        return parse_docx(source if isinstance(source, str) else io.BytesIO(source))
+    elif file_type == "txt":
+        return parse_txt(source)
+    else:
+        return "Unsupported file format."
+
+def parse_document(uploaded_file):
+    """
+    Main entry point to parse various file types.
+
+    Accepts any file-like object with a `name` attribute, e.g. a Streamlit
+    UploadedFile or a file opened in binary mode.
+    """
+    if uploaded_file is None:
+        return None
+    
+    return parse_bytes(uploaded_file.read(), file_extension(uploaded_file.name))
+
+# --- PARSE CACHE ---
+def parser_signature():
+    """
+    Parser version plus the settings that change its output, for cache keys.
+    """
+    return f"{PARSER_VERSION}/pages={config.PDF_MAX_PAGES}/chars={config.PDF_MAX_CHARS}/docx={config.DOCX_BACKEND}"
+
+@lru_cache(maxsize=None)
+def get_parse_cache():
+    """
+    Process-wide cache of cleaned document text with its page counts and
+    truncation flag, keyed by content hash.
+    """
+    db_path = os.path.join(config.CACHE_DIR, "parse_cache.sqlite3") if config.PARSE_CACHE_DISK else None
+    return TieredCache("parsed_text", max_items=config.PARSE_CACHE_SIZE, db_path=db_path,
+                       max_disk_items=config.PARSE_CACHE_DISK_ITEMS or None)
+
+def parse_file(path):
+    """
+    Parses a document from a path on disk.
+    """
+    with open(path, "rb") as f:
+        return parse_document(f)
+
+def is_parse_error(text):
+    """
+    True if `text` is one of the error messages returned by the parsers.
+    """
+    return not text or text.startswith("Error parsing") or text == "Unsupported file format."
+
+def list_documents(directory):
+    """
+    Returns the supported documents in a directory, sorted by name.
+    """
+    paths = []
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        if os.path.isfile(path) and file_extension(name) in SUPPORTED_EXTENSIONS:
+            paths.append(path)
+    return paths
@@ -0,0 +1,45 @@
+from skillgap.analyzer import MATCH_THRESHOLD, calculate_content_similarity, calculate_similarity, composite_score
+from skillgap.extractor import extract_context, extract_segments_batch
+from skillgap.ingest import ingest_bytes
+from skillgap.sections import extraction_text
+
+
+def load_text(path):
+    """
+    Parses and normalizes a document on disk. Raises ValueError if it can't be parsed.
+    """
+    with open(path, "rb") as f:
+        result = ingest_bytes(f.read(), path)
+    if result["error"]:
+        raise ValueError(result["error"])
+    return result["text"]
+
+def analyze_texts(resume_text, jd_text, jd_skills=None, threshold=MATCH_THRESHOLD, skill_importance=0.7, resume_skills=None):
+    """
+    Runs extraction and gap analysis for one resume against one JD.
+
+    `jd_skills` can be passed in when the same JD is scored against many
+    resumes, so it is only extracted once; `resume_skills` when they were
+    already extracted in a batch. Whatever is missing is extracted in a
+    single nlp.pipe pass.
+    """
+    pending = [text for text, skills in ((resume_text, resume_skills), (jd_text, jd_skills)) if skills is None]
+    extracted = iter(extraction.skills() for extraction in extract_segments_batch([extraction_text(text) for text in pending])[0])
+    if resume_skills is None:
+        resume_skills = next(extracted)
+    if jd_skills is None:
+        jd_skills = next(extracted)
+    
+    match_pct, missing, matched = calculate_similarity(resume_skills, jd_skills, threshold)
+    content_score = calculate_content_similarity(resume_text, jd_text)
+    
+    return {
+        "resume_skills": resume_skills,
+        "jd_skills": jd_skills,
+        "resume_context": extract_context(resume_text),
+        "match_percentage": match_pct,
+        "content_similarity": content_score,
+        "composite_score": composite_score(match_pct, content_score, skill_importance),
+        "matched": matched,
+        "missing": missing
+    }
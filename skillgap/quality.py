@@ -0,0 +1,40 @@
+from skillgap.keywords import SECTION_KEYWORDS, get_keyword_scanner
+from skillgap.sections import section_names
+
+
+def analyze_resume_quality(text, sections=None):
+    """
+    Analyzes resume content for structure and quality indicators.
+
+    Section presence is read from the headers `sections` (from
+    segment_sections) recognized; sections not found that way, e.g. inline
+    "Skills: Python, SQL" lines, fall back to a keyword scan of the text.
+    """
+    score = 100
+    issues = []
+    
+    # 1. Length Check
+    words = len(text.split())
+    if words < 200:
+        score -= 20
+        issues.append("Resume is too short (<200 words). Add more detail.")
+    elif words > 2000:
+        score -= 10
+        issues.append("Resume might be too long (>2000 words). Consider summarizing.")
+        
+    # 2. Section Check
+    # Prefer segmented headers; fall back per section to a case-insensitive keyword search.
+    found = section_names(sections or [])
+    if not found.issuperset(SECTION_KEYWORDS):
+        found |= get_keyword_scanner().scan(text).get("section", set())
+    for sec in SECTION_KEYWORDS:
+        if sec not in found:
+            score -= 15
+            issues.append(f"Missing section: '{sec.capitalize()}'.")
+            
+    # 3. Email Check
+    if "@" not in text:
+        score -= 10
+        issues.append("No email address detected.")
+        
+    return max(0, score), issues
@@ -0,0 +1,94 @@
+from array import array
+from collections import Counter
+
+
+# --- EXTRACTION RESULT ---
+class SkillExtraction:
+    """
+    Every skill occurrence found in one document: canonical skill IDs with
+    their character spans, kept in parallel int arrays.
+
+        result = SkillExtraction()
+        result.add(3, "Python", 10, 16)
+        result.skills()   # ["Python"]
+        result.counts()   # {"Python": 1}
+        result.to_dict()  # plain lists, cheap to keep in session state
+    """
+
+    __slots__ = ("names", "skill_ids", "starts", "ends", "taxonomy_version")
+
+    def __init__(self, taxonomy_version=""):
+        self.names = {}  # skill id -> canonical name, for the skills present
+        self.skill_ids = array("l")
+        self.starts = array("l")
+        self.ends = array("l")
+        self.taxonomy_version = taxonomy_version
+
+    def add(self, skill_id, name, start, end):
+        self.names[skill_id] = name
+        self.skill_ids.append(skill_id)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def extend(self, other, offset=0):
+        """
+        Appends another result's occurrences, shifting their spans by
+        `offset` (the other text's position within this one).
+        """
+        self.names.update(other.names)
+        self.skill_ids.extend(other.skill_ids)
+        self.starts.extend(start + offset for start in other.starts)
+        self.ends.extend(end + offset for end in other.ends)
+
+    @classmethod
+    def from_doc(cls, doc, taxonomy):
+        """
+        Collects the SKILL entities of a processed Doc.
+        """
+        result = cls(taxonomy.version)
+        for ent in doc.ents:
+            if ent.label_ == "SKILL" and ent.kb_id_ in taxonomy.ids:
+                result.add(taxonomy.ids[ent.kb_id_], ent.kb_id_, ent.start_char, ent.end_char)
+        return result
+
+    def __len__(self):
+        return len(self.skill_ids)
+
+    def skills(self):
+        """
+        Distinct canonical skill names, sorted.
+        """
+        return sorted(self.names.values())
+
+    def counts(self):
+        """
+        Occurrences per canonical skill name.
+        """
+        return {self.names[skill_id]: n for skill_id, n in Counter(self.skill_ids).items()}
+
+    def spans(self, skill=None):
+        """
+        (name, start, end) character spans, in document order; optionally
+        only those of one skill.
+        """
+        return [(self.names[skill_id], start, end)
+                for skill_id, start, end in zip(self.skill_ids, self.starts, self.ends)
+                if skill is None or self.names[skill_id] == skill]
+
+    def to_dict(self):
+        return {
+            "taxonomy_version": self.taxonomy_version,
+            "names": [[skill_id, name] for skill_id, name in self.names.items()],
+            "skill_ids": self.skill_ids.tolist(),
+            "starts": self.starts.tolist(),
+            "ends": self.ends.tolist()
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        result = cls(data["taxonomy_version"])
+        result.names = {skill_id: name for skill_id, name in data["names"]}
+        result.skill_ids = array("l", data["skill_ids"])
+        result.starts = array("l", data["starts"])
+        result.ends = array("l", data["ends"])
+        return result
@@ -0,0 +1,88 @@
+import re
+
+from skillgap import config
+
+# --- SECTION HEADERS ---
+# Canonical section name -> header lines that open it (compared lowercased,
+# without surrounding punctuation)
+SECTION_ALIASES = {
+    "summary": ["summary", "professional summary", "profile", "objective", "career objective", "about me"],
+    "experience": ["experience", "work experience", "professional experience", "employment", "employment history", "work history", "internships", "internship"],
+    "education": ["education", "academic background", "academics", "qualifications and education"],
+    "skills": ["skills", "technical skills", "key skills", "core skills", "core competencies", "skills and tools", "tools and technologies", "technologies"],
+    "projects": ["projects", "personal projects", "academic projects", "key projects"],
+    "certifications": ["certifications", "certificates", "licenses and certifications", "courses"],
+    "achievements": ["achievements", "awards", "honors", "honors and awards", "accomplishments"],
+    "responsibilities": ["responsibilities", "key responsibilities", "what you will do", "what you'll do", "the role", "role description"],
+    "requirements": ["requirements", "qualifications", "minimum qualifications", "preferred qualifications", "what you will need", "what you'll need", "must have", "nice to have", "who you are"],
+    "benefits": ["benefits", "perks", "what we offer", "perks and benefits"],
+    "about": ["about us", "about the company", "who we are", "company overview"],
+    "interests": ["interests", "hobbies", "hobbies and interests"],
+    "references": ["references", "referees"],
+    "languages": ["languages"],
+}
+
+# Sections skill extraction reads from large documents; everything else
+# (contact block, benefits, company blurb, references, ...) is skipped
+EXTRACTION_SECTIONS = ("summary", "experience", "skills", "projects", "certifications", "achievements", "responsibilities", "requirements")
+
+_HEADER_LOOKUP = {alias: name for name, aliases in SECTION_ALIASES.items() for alias in aliases}
+_MAX_HEADER_CHARS = max(len(alias) for alias in _HEADER_LOOKUP) + 4
+
+
+def _header_name(line):
+    if len(line) > _MAX_HEADER_CHARS:
+        return None
+    key = re.sub(r'\s+', ' ', line.strip().strip(":-–—•*#| ").lower().replace("&", "and"))
+    return _HEADER_LOOKUP.get(key)
+
+def segment_sections(text):
+    """
+    Splits layout-preserving text into sections in one pass over its lines.
+
+    Returns a list of {"name", "start", "end"} character ranges covering the
+    whole text; the part before the first recognized header is named "header".
+    """
+    sections = []
+    current = {"name": "header", "start": 0}
+    offset = 0
+    for line in text.splitlines(keepends=True):
+        name = _header_name(line)
+        if name:
+            if offset > current["start"]:
+                current["end"] = offset
+                sections.append(current)
+            current = {"name": name, "start": offset}
+        offset += len(line)
+    if offset > current["start"]:
+        current["end"] = offset
+        sections.append(current)
+    return sections
+
+def section_names(sections):
+    """
+    Names of the recognized sections (the leading "header" block excluded).
+    """
+    return {s["name"] for s in sections if s["name"] != "header"}
+
+def extraction_text(text, sections=None):
+    """
+    The parts of a document skill extraction should read, as (offset, text)
+    segments so spans found in them map back onto the original text. Small
+    documents are one segment; large ones are cut down to EXTRACTION_SECTIONS
+    when any of those were recognized.
+    """
+    if not config.LARGE_DOC_CHARS or len(text) <= config.LARGE_DOC_CHARS:
+        return [(0, text)]
+    
+    if sections is None:
+        sections = segment_sections(text)
+    relevant = [(s["start"], text[s["start"]:s["end"]]) for s in sections if s["name"] in EXTRACTION_SECTIONS]
+    return relevant or [(0, text)]
+
+def joined_extraction_text(text, sections=None):
+    """
+    The extraction_text segments as one string, for callers that only need
+    skill names, not spans.
+    """
+    return "\n".join(segment for _, segment in extraction_text(text, sections))
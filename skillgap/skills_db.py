@@ -0,0 +1,49 @@
+# --- SKILLS DATABASE (Formerly src/skills_db.py) ---
+SKILL_DB = [
+    # Programming Languages
+    "Python", "Java", "C++", "C#", "JavaScript", "TypeScript", "Ruby", "Swift", "Go", "Kotlin", "Rust", "PHP", "R", "Matlab", "Scala", "Dart", "HTML", "CSS", "SQL", "NoSQL", "Bash", "Shell", "Perl", "Lua",
+    
+    # Machine Learning & AI
+    "Machine Learning", "Deep Learning", "Neural Networks", "NLP", "Computer Vision", "Reinforcement Learning", "Generative AI", "LLM", "Transformers", "BERT", "GPT", "TensorFlow", "PyTorch", "Keras", "Scikit-learn", "Pandas", "NumPy", "Matplotlib", "Seaborn", "OpenCV", "Hugging Face", "MLOps",
+    
+    # Data Science & Analytics
+    "Data Analysis", "Data Visualization", "Big Data", "Spark", "Hadoop", "Hive", "Tableau", "Power BI", "Excel", "Data Mining", "Statistics", "A/B Testing", "Snowflake", "Databricks", "ETL", "Data Pipelines",
+    
+    # Web Development
+    "React", "Angular", "Vue", "Node.js", "Express", "Django", "Flask", "FastAPI", "Spring Boot", "ASP.NET", "Laravel", "jQuery", "Bootstrap", "Tailwind CSS", "SASS", "LESS", "GraphQL", "REST API", "WebSockets",
+    
+    # Cloud & DevOps
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Jenkins", "Git", "GitHub", "GitLab", "CI/CD", "Terraform", "Ansible", "Linux", "Unix", "Nginx", "Apache", "Heroku", "Vercel", "Netlify",
+    
+    # Databases
+    "MySQL", "PostgreSQL", "MongoDB", "Redis", "Oracle", "Cassandra", "DynamoDB", "Firebase", "SQLite", "MariaDB",
+    
+    # Soft Skills
+    "Communication", "Teamwork", "Leadership", "Problem Solving", "Critical Thinking", "Project Management", "Agile", "Scrum", "Time Management", "Adaptability", "Collaboration", "Creativity", "Emotional Intelligence", "Conflict Resolution", "Decision Making", "Mentoring", "Presentation Skills", "Negotiation",
+    
+    # Tools & Others
+    "Jira", "Trello", "Asana", "Slack", "Zoom", "Microsoft Office", "Adobe Creative Suite", "Photoshop", "Illustrator", "Figma", "Sketch", "InVision", "Salesforce", "SAP"
+]
+
+# Skills matched case-sensitively (a lowercase "r" is not the language)
+CASE_SENSITIVE_SKILLS = {"R"}
+
+# Alternate spellings, resolved to the canonical SKILL_DB entry at extraction
+# time so downstream stages only ever see one name per skill
+SKILL_ALIASES = {
+    "Natural Language Processing": "NLP",
+    "React.js": "React",
+    "ReactJS": "React",
+    "Vue.js": "Vue",
+    "VueJS": "Vue",
+    "NodeJS": "Node.js",
+    "Amazon Web Services": "AWS",
+    "Google Cloud": "GCP",
+    "Google Cloud Platform": "GCP",
+    "Golang": "Go",
+    "K8s": "Kubernetes",
+    "Postgres": "PostgreSQL",
+    "sklearn": "Scikit-learn",
+    "Large Language Models": "LLM",
+    "Microsoft Excel": "Excel"
+}
@@ -0,0 +1,184 @@
+import csv
+import importlib
+import json
+import os
+import threading
+
+from skillgap import config, skills_db
+from skillgap.cache import content_key
+
+
+# --- SKILL TAXONOMY ---
+class Taxonomy:
+    """
+    Canonical skills with dense integer IDs (0..n-1, in load order) and the
+    alias terms that resolve to them.
+
+        taxonomy = Taxonomy(["Machine Learning"], {"ML": 0})
+        list(taxonomy.terms())  # [("Machine Learning", 0), ("ML", 0)]
+    """
+
+    def __init__(self, names, aliases=None, case_sensitive=()):
+        self.names = []
+        self.ids = {}
+        self.aliases = {}
+        self.case_sensitive = set(case_sensitive)
+        for name in names:
+            self.add(name)
+        for alias, skill_id in (aliases or {}).items():
+            self.aliases.setdefault(alias, skill_id)
+        self._version = None
+        self._folded = None
+
+    def add(self, name, aliases=(), case_sensitive=False):
+        """
+        Adds a skill (or merges aliases into an existing one); returns its ID.
+        """
+        skill_id = self.ids.get(name)
+        if skill_id is None:
+            skill_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+        for alias in aliases:
+            if alias and alias != name and alias not in self.ids:
+                self.aliases.setdefault(alias, skill_id)
+        if case_sensitive:
+            self.case_sensitive.add(name)
+        self._version = None
+        self._folded = None
+        return skill_id
+
+    def __len__(self):
+        return len(self.names)
+
+    def terms(self):
+        """
+        Yields every matchable (term, skill_id): canonical names, then aliases.
+        """
+        yield from zip(self.names, range(len(self.names)))
+        yield from self.aliases.items()
+
+    def canonical(self, term):
+        """
+        Canonical name for a skill name or alias (case-insensitive unless the
+        term is case-sensitive), or None if the taxonomy doesn't know it.
+        """
+        skill_id = self.ids.get(term, self.aliases.get(term))
+        if skill_id is None:
+            if self._folded is None:
+                self._folded = {}
+                for known, known_id in self.terms():
+                    if known not in self.case_sensitive:
+                        self._folded.setdefault(known.lower(), known_id)
+            skill_id = self._folded.get(term.lower())
+        return None if skill_id is None else self.names[skill_id]
+
+    @property
+    def version(self):
+        """
+        Content hash of the taxonomy; changes whenever a name or alias does.
+        """
+        if self._version is None:
+            payload = json.dumps([self.names, sorted(self.aliases.items()), sorted(self.case_sensitive)])
+            self._version = content_key(payload).split(":")[0][:16]
+        return self._version
+
+
+def _split_aliases(value):
+    if isinstance(value, list):
+        return [a.strip() for a in value]
+    return [a.strip() for a in (value or "").split("|")]
+
+def _truthy(value):
+    return str(value).strip().lower() in ("1", "true", "yes")
+
+def _iter_taxonomy_rows(path):
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    else:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+def load_taxonomy(path):
+    """
+    Loads a taxonomy from CSV or JSONL. Each row has a `name`, optional
+    `aliases` ("|"-separated in CSV, a list in JSONL) and an optional
+    `case_sensitive` flag. Rows repeating a name merge their aliases.
+    """
+    taxonomy = Taxonomy([])
+    for row in _iter_taxonomy_rows(path):
+        name = (row.get("name") or "").strip()
+        if name:
+            taxonomy.add(name, _split_aliases(row.get("aliases")), _truthy(row.get("case_sensitive", "")))
+    return taxonomy
+
+def builtin_taxonomy():
+    """
+    The bundled SKILL_DB and SKILL_ALIASES as a taxonomy.
+    """
+    taxonomy = Taxonomy(skills_db.SKILL_DB, case_sensitive=skills_db.CASE_SENSITIVE_SKILLS)
+    for alias, name in skills_db.SKILL_ALIASES.items():
+        taxonomy.add(name, [alias])
+    return taxonomy
+
+def _load_configured(path):
+    if path:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Skill taxonomy not found: {path}")
+        return load_taxonomy(path)
+    return builtin_taxonomy()
+
+# --- ACTIVE TAXONOMY ---
+_ACTIVE = None
+_ACTIVE_LOCK = threading.Lock()
+
+def get_taxonomy():
+    """
+    The active taxonomy: config.TAXONOMY_PATH if set, else the built-in one.
+    Replaced in place by reload_taxonomy().
+    """
+    global _ACTIVE
+    if _ACTIVE is None:
+        with _ACTIVE_LOCK:
+            if _ACTIVE is None:
+                _ACTIVE = _load_configured(config.TAXONOMY_PATH)
+    return _ACTIVE
+
+def reload_taxonomy(path=None):
+    """
+    Re-reads the taxonomy (from `path`, which also becomes the configured
+    source, or else from config.TAXONOMY_PATH / the skills_db module) and
+    makes it active if its version changed. Returns (taxonomy, changed).
+
+    Loaded pipelines pick the new version up on their next document; cached
+    extractions are keyed by version, so stale results are never served.
+    """
+    global _ACTIVE
+    if path is not None:
+        config.TAXONOMY_PATH = path
+    if not config.TAXONOMY_PATH:
+        importlib.reload(skills_db)
+    taxonomy = _load_configured(config.TAXONOMY_PATH)
+    with _ACTIVE_LOCK:
+        changed = _ACTIVE is None or taxonomy.version != _ACTIVE.version
+        if changed:
+            _ACTIVE = taxonomy
+        return _ACTIVE, changed
+
+def canonicalize_skills(skills, taxonomy=None):
+    """
+    Maps skills to their canonical names and drops duplicates, keeping the
+    first occurrence's order. Unknown skills are kept as given.
+    """
+    if taxonomy is None:
+        taxonomy = get_taxonomy()
+    canonical = []
+    seen = set()
+    for skill in skills:
+        name = taxonomy.canonical(skill) or skill
+        if name not in seen:
+            seen.add(name)
+            canonical.append(name)
+    return canonical
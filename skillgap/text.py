@@ -0,0 +1,55 @@
+import re
+
+
+def clean_text(text):
+    """
+    Cleans and normalizes text.
+    """
+    if not text:
+        return ""
+    
+    # Replace multiple newlines/spaces with single space
+    text = re.sub(r'\s+', ' ', text)
+    
+    # Strip leading/trailing whitespace
+    text = text.strip()
+    
+    return text
+
+def normalize_text(text):
+    """
+    Normalizes whitespace but keeps the document layout: spaces are collapsed
+    within each line and runs of blank lines become a single blank line.
+    """
+    if not text:
+        return ""
+    
+    text = re.sub(r'[^\S\n]+', ' ', text.replace('\r\n', '\n').replace('\r', '\n'))
+    text = re.sub(r' ?\n ?', '\n', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+    
+    return text.strip()
+
+# Preferred chunk boundaries, strongest first: paragraph, line, sentence, word
+_CHUNK_BREAKS = [re.compile(r'\n\s*\n'), re.compile(r'\n'), re.compile(r'(?<=[.!?;])\s'), re.compile(r'\s')]
+
+def iter_text_chunks(text, max_chars):
+    """
+    Yields (offset, chunk) pieces of at most `max_chars`, cut at the
+    strongest boundary available in each window (paragraph, then line,
+    sentence, word) so skills are not split across chunks.
+    """
+    start = 0
+    while len(text) - start > max_chars:
+        window_end = start + max_chars
+        end = window_end
+        for pattern in _CHUNK_BREAKS:
+            # Last boundary in the second half of the window
+            breaks = [m.end() for m in pattern.finditer(text, start + max_chars // 2, window_end)]
+            if breaks:
+                end = breaks[-1]
+                break
+        yield start, text[start:end]
+        start = end
+    if start < len(text):
+        yield start, text[start:]
@@ -0,0 +1,80 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+class StageTimer:
+    """
+    Records the wall-clock duration of named pipeline stages.
+
+        timer = StageTimer()
+        with timer.stage("parse") as stage:
+            stage["pages"] = 3
+        timer.stages  # [{"name": "parse", "pages": 3, "seconds": 0.012}]
+    """
+
+    def __init__(self):
+        self.stages = []
+
+    @contextmanager
+    def stage(self, name, **metrics):
+        record = {"name": name, **metrics}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            self.stages.append(record)
+
+    def total(self):
+        return sum(s["seconds"] for s in self.stages)
+
+
+def current_rss():
+    """
+    Resident set size of this process in bytes, or None where /proc is
+    unavailable.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def peak_rss():
+    """
+    High-water mark of this process's RSS in bytes, or None.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and KB elsewhere
+    return peak if sys.platform == "darwin" else peak * 1024
+
+@contextmanager
+def track_process_memory():
+    """
+    Measures process memory around the block. Yields a dict filled in on exit
+    with "rss_delta" (change in resident memory), "peak_rss" (the process's
+    RSS high-water mark) and "peak_growth" (how much the block raised it).
+
+    These are process-wide figures: they include native allocations such as
+    MuPDF's, and anything other threads (sessions) do meanwhile. Nothing is
+    switched on or off, so concurrent measurements don't interfere.
+    """
+    record = {}
+    rss_before = current_rss()
+    peak_before = peak_rss()
+    try:
+        yield record
+    finally:
+        rss_after = current_rss()
+        record["peak_rss"] = peak_rss()
+        record["rss_delta"] = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+        record["peak_growth"] = record["peak_rss"] - peak_before if peak_before is not None else None
@@ -0,0 +1,68 @@
+import importlib
+import threading
+
+from skillgap import config
+from skillgap.timing import StageTimer
+
+_LOCK = threading.Lock()
+_STATUS = {"state": "idle", "stages": [], "error": None}
+
+
+# --- MODEL WARM-UP ---
+def warm_up(mode=None, timer=None):
+    """
+    Imports the heavy libraries, loads both models and maps the taxonomy
+    embeddings, timing each step into `timer` (a new StageTimer by default),
+    which is returned. Raises if a step fails; the steps timed so far stay in
+    the timer.
+    """
+    from skillgap.analyzer import load_sbert_model
+    from skillgap.embeddings import taxonomy_embeddings
+    from skillgap.extractor import load_model
+
+    timer = timer or StageTimer()
+    with timer.stage("import spacy"):
+        importlib.import_module("spacy")
+    with timer.stage("load spacy model"):
+        load_model(mode)
+    if config.ENCODER_BACKEND == "onnx":
+        with timer.stage("import onnxruntime"):
+            importlib.import_module("onnxruntime")
+    else:
+        with timer.stage("import sentence-transformers"):
+            importlib.import_module("sentence_transformers")
+    with timer.stage("load sentence encoder"):
+        load_sbert_model()
+    with timer.stage("load skill embeddings"):
+        taxonomy_embeddings()
+    return timer
+
+def _run(mode):
+    timer = StageTimer()
+    # Expose the (growing) stage list while the warm-up runs
+    _STATUS["stages"] = timer.stages
+    try:
+        warm_up(mode, timer)
+        _STATUS["state"] = "done"
+    except Exception as e:
+        _STATUS["state"] = "failed"
+        _STATUS["error"] = str(e)
+
+def start_warmup(mode=None):
+    """
+    Starts the warm-up on a daemon thread, once per process. Safe to call on
+    every Streamlit rerun; later calls are no-ops.
+    """
+    with _LOCK:
+        if _STATUS["state"] != "idle":
+            return False
+        _STATUS["state"] = "running"
+    threading.Thread(target=_run, args=(mode,), name="skillgap-warmup", daemon=True).start()
+    return True
+
+def warmup_status():
+    """
+    Snapshot of the warm-up: state (idle / running / done / failed), the
+    stages timed so far and any error.
+    """
+    return {"state": _STATUS["state"], "stages": list(_STATUS["stages"]), "error": _STATUS["error"]}
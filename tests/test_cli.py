@@ -0,0 +1,34 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _run(*args):
+    return subprocess.run([sys.executable, *args], cwd=ROOT, capture_output=True, text=True, timeout=600)
+
+def _encoder_cached():
+    from huggingface_hub import try_to_load_from_cache
+    from skillgap.analyzer import SBERT_MODEL_NAME
+    return isinstance(try_to_load_from_cache(f"sentence-transformers/{SBERT_MODEL_NAME}", "config.json"), str)
+
+def test_imports_print_nothing():
+    # Anything a library prints on import ends up in front of the CLI's JSON
+    result = _run("-c", "import skillgap.cli, skillgap.parser, skillgap.bulk")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == ""
+
+@pytest.mark.skipif(not _encoder_cached(), reason="sentence encoder not downloaded")
+def test_analyze_json_stdout_parses(tmp_path):
+    resume = tmp_path / "resume.txt"
+    resume.write_text("Skills\nPython, SQL, Machine Learning\n")
+    jd = tmp_path / "jd.txt"
+    jd.write_text("Requirements\nPython, Docker, Machine Learning\n")
+    result = _run("-m", "skillgap", "analyze", str(resume), str(jd), "--json")
+    assert result.returncode == 0, result.stderr
+    payload = json.loads(result.stdout)
+    assert "Python" in payload["resume_skills"]
@@ -0,0 +1,23 @@
+import pymupdf
+
+from skillgap import config
+from skillgap.cache import TieredCache
+from skillgap.ingest import ingest_bytes
+
+
+def _pdf(pages):
+    doc = pymupdf.open()
+    for i in range(pages):
+        doc.new_page().insert_text((50, 50), f"Page {i + 1}: Python, SQL")
+    return doc.tobytes()
+
+def test_page_limit_holds_for_cache_hits(monkeypatch):
+    cache = TieredCache("test_parse")
+    data = _pdf(12)
+    monkeypatch.setattr(config, "MAX_UPLOAD_PAGES", 0)
+    assert ingest_bytes(data, "long.pdf", cache)["error"] is None
+    
+    monkeypatch.setattr(config, "MAX_UPLOAD_PAGES", 5)
+    result = ingest_bytes(data, "long.pdf", cache)
+    assert result["cached"]
+    assert "too many pages" in result["error"]
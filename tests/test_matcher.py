@@ -0,0 +1,21 @@
+import spacy
+
+from skillgap.matcher import SkillMatcher
+from skillgap.text import normalize_text
+
+
+def _matcher(nlp, names):
+    matcher = SkillMatcher(names)
+    for skill_id, name in enumerate(names):
+        matcher.add(skill_id, [token.text for token in nlp.make_doc(name)])
+    return matcher
+
+def test_skill_wrapped_across_lines():
+    nlp = spacy.blank("en")
+    matcher = _matcher(nlp, ["Machine Learning", "Power BI", "Spring Boot"])
+    text = normalize_text("Machine\nLearning models, Power\nBI dashboards and Spring  Boot services")
+    spans = matcher(nlp.make_doc(text))
+    assert [span.kb_id_ for span in spans] == ["Machine Learning", "Power BI", "Spring Boot"]
+    # Spans still cover the original tokens, line break included
+    assert spans[0].text == "Machine\nLearning"
+    assert text[spans[1].start_char:spans[1].end_char] == "Power\nBI"
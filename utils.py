@@ -1,9 +1,15 @@
 import streamlit as st
 import os
-import re
+from skillgap import config
+from skillgap.warmup import start_warmup
 
 # --- STYLES (Formerly src/styles.py) ---
 def apply_custom_css():
+    # Every page runs this first, so the NLP models start loading in the
+    # background whichever page a session lands on (once per process)
+    if config.WARMUP:
+        start_warmup()
+    
     st.markdown("""
     <style>
         /* Global Animated Background - Premium Dark Theme */
@@ -390,18 +396,41 @@ def render_top_nav():
         
     st.markdown("---")
 
-# --- UTILS (Formerly src/utils.py) ---
-def clean_text(text):
+# --- UTILS ---
+# Text helpers live in the Streamlit-free core; re-exported for the pages.
+from skillgap.text import clean_text
+
+# --- SHARED GAP ANALYSIS ---
+# The expensive stages are memoized on their inputs across sessions and
+# reruns; widget changes that don't alter those inputs reuse the results.
+@st.cache_data(show_spinner=False, max_entries=256)
+def _cached_similarity(resume_skills, jd_skills, threshold, taxonomy_version):
+    from skillgap.analyzer import calculate_similarity
+    # Raw scores: pages round them for display
+    return calculate_similarity(list(resume_skills), list(jd_skills), threshold, score_digits=None)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def get_content_similarity(resume_text, jd_text):
     """
-    Cleans and normalizes text.
+    calculate_content_similarity (TF-IDF fit), memoized on the two texts.
     """
-    if not text:
-        return ""
-    
-    # Replace multiple newlines/spaces with single space
-    text = re.sub(r'\s+', ' ', text)
-    
-    # Strip leading/trailing whitespace
-    text = text.strip()
+    from skillgap.analyzer import calculate_content_similarity
+    return calculate_content_similarity(resume_text, jd_text)
+
+def get_gap_analysis(resume_skills, jd_skills, threshold=None):
+    """
+    calculate_similarity for this session, computed once and kept in
+    session_state: the Analysis page stores it, the Report page reuses it
+    while the skill lists, threshold and taxonomy are unchanged.
+    """
+    from skillgap.analyzer import MATCH_THRESHOLD
+    from skillgap.taxonomy import get_taxonomy
     
-    return text
+    threshold = MATCH_THRESHOLD if threshold is None else threshold
+    key = (tuple(resume_skills), tuple(jd_skills), threshold, get_taxonomy().version)
+    analysis = st.session_state.get('gap_analysis')
+    if analysis is None or analysis['key'] != key:
+        match_percentage, missing, matched = _cached_similarity(*key)
+        analysis = {'key': key, 'match_percentage': match_percentage, 'missing': missing, 'matched': matched}
+        st.session_state['gap_analysis'] = analysis
+    return analysis['match_percentage'], analysis['missing'], analysis['matched']